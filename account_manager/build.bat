@@ -18,8 +18,8 @@ echo       Done.
 echo.
 
 REM Step 2: Build executable
-echo [2/4] Building executable with PyInstaller...
-py -m PyInstaller --clean --onefile --windowed --name AccountManager main.py
+echo [2/4] Building executable with PyInstaller (optimized bytecode)...
+py -O -m PyInstaller --clean --onefile --windowed --name AccountManager main.py
 echo       Done.
 echo.
 
@@ -6,14 +6,20 @@ import sqlite3
 import os
 import sys
 import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Tuple, Optional, Dict, Any
 
+from database.pool import CONNECTION_PRAGMAS
+
 # Import helper for date normalization
 try:
-    from utils.helpers import normalize_date_for_sort
+    from utils.helpers import normalize_date_for_sort, get_current_date
 except ImportError:
     # Fallback if import fails
+    def get_current_date(format_str='%d-%m-%Y'):
+        return datetime.now().strftime(format_str)
+
     def normalize_date_for_sort(date_str):
         if not date_str:
             return ''
@@ -24,16 +30,51 @@ except ImportError:
         return date_str
 
 
+# Bumped whenever a migration is added; stored in PRAGMA user_version
+#   1 - users.email no longer UNIQUE
+#   2 - transactions accept 'cash' as from/to type
+#   3 - transactions_fts search index
+#   4 - balances and amounts rounded to whole paise
+#   5 - companies_fts and users_fts search indexes
+SCHEMA_VERSION = 5
+
+# Text columns covered by each table's full-text search index
+SEARCH_INDEX_COLUMNS = {
+    'transactions': ('description', 'reference'),
+    'companies': ('name', 'email', 'phone'),
+    'users': ('name', 'email', 'department'),
+}
+
+
+def round_paise(amount: float) -> float:
+    """Round a rupee amount to whole paise so stored money values never drift"""
+    return int(round(amount * 100)) / 100
+
+
 class DatabaseManager:
     """Manages SQLite database connections and operations"""
 
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, conn: sqlite3.Connection = None):
         """
         Initialize database manager
 
         Args:
             db_path: Path to SQLite database file. If None, uses default path.
+            conn: Existing connection to use (e.g. borrowed from a SQLitePool).
+                  The caller keeps ownership and is responsible for closing it.
         """
+        if conn is not None:
+            self.connection = conn
+            self.connection.row_factory = sqlite3.Row
+            self._register_functions()
+            self._owns_connection = False
+            self._bulk_depth = 0
+            self._init_cache()
+            # Main database file backing the connection ('' for in-memory)
+            self.db_path = db_path or conn.execute("PRAGMA database_list").fetchone()[2] or ':memory:'
+            self.create_tables()
+            return
+
         if db_path is None:
             # Determine the correct base directory
             # When running as PyInstaller executable, use the .exe directory
@@ -50,9 +91,14 @@ class DatabaseManager:
 
         self.db_path = db_path
         self.connection = None
+        self._owns_connection = True
+        self._bulk_depth = 0
+        self._init_cache()
 
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Ensure data directory exists (none for ':memory:' or a bare filename)
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
 
         # Initialize database
         self.connect()
@@ -61,19 +107,146 @@ class DatabaseManager:
     def connect(self):
         """Establish database connection"""
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            # Room for every distinct statement the manager issues
+            self.connection = sqlite3.connect(self.db_path, cached_statements=256)
             self.connection.row_factory = sqlite3.Row  # Return rows as dictionaries
+            if self.db_path != ':memory:':
+                # WAL lets readers run alongside a writer; mmap serves reads from the page cache
+                for pragma in CONNECTION_PRAGMAS:
+                    self.connection.execute(pragma)
+            self._register_functions()
+            self._owns_connection = True
             return self.connection
         except sqlite3.Error as e:
             print(f"Database connection error: {e}")
             raise
 
+    def _register_functions(self):
+        """Make Python helpers callable from SQL on the current connection"""
+        self.connection.create_function(
+            'normalize_date', 1, normalize_date_for_sort, deterministic=True
+        )
+
     def close(self):
         """Close database connection"""
         if self.connection:
-            self.connection.close()
+            # Injected (pooled) connections are closed by their owner
+            if self._owns_connection:
+                try:
+                    # Refresh planner statistics where they are stale (cheap no-op otherwise)
+                    self.connection.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    print(f"Database optimize skipped: {e}")
+                finally:
+                    self.connection.close()
             self.connection = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the connection when leaving a ``with DatabaseManager(...)`` block"""
+        self.close()
+        return False
+
+    @contextmanager
+    def bulk(self):
+        """
+        Group many write operations into a single transaction
+
+        Inside the block the per-method commits are suppressed, so the whole
+        sequence costs one COMMIT (and one fsync) instead of one per call.
+        Each write method runs under its own SAVEPOINT, so one that fails is
+        undone even if the caller catches the error and carries on.
+        An exception leaving the block rolls back everything written in it.
+
+        Usage:
+            with db.bulk():
+                db.add_company(...)
+                db.add_transaction(...)
+        """
+        if self._bulk_depth:
+            # Nested block - the outermost one owns the transaction
+            self._bulk_depth += 1
+            try:
+                yield self
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        if self.connection.in_transaction:
+            # Never commit someone else's half-finished work on their behalf
+            raise RuntimeError("bulk() cannot start while another transaction is open")
+        self.connection.execute("BEGIN IMMEDIATE")
+        self._bulk_depth = 1
+        try:
+            yield self
+        except BaseException:
+            self._bulk_depth = 0
+            self.connection.rollback()
+            raise
+        self._bulk_depth = 0
+        self.connection.commit()
+
+    def _init_cache(self):
+        """Reset the result-set cache used by the get_all_* methods"""
+        self._list_cache = {}
+
+    def _cached_rows(self, name: str, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        """
+        Run a read query, reusing the previous result while the database is unchanged
+
+        The cache key combines the connection's total_changes, which counts every
+        write made on it (by any manager sharing it, whatever the statement), with
+        SQLite's data_version, which changes when another connection commits.
+        Only committed data is cached: inside an open transaction the query always
+        runs, since a rollback would undo rows without lowering total_changes.
+        Callers get their own copies of the rows.
+        """
+        if self.connection.in_transaction:
+            return [dict(row) for row in self.execute_query(query, params)]
+
+        data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        key = (data_version, self.connection.total_changes, params)
+
+        cached = self._list_cache.get(name)
+        if cached is None or cached[0] != key:
+            rows = tuple(dict(row) for row in self.execute_query(query, params))
+            cached = self._list_cache[name] = (key, rows)
+        return [dict(row) for row in cached[1]]
+
+    def _commit(self):
+        """Commit the current transaction unless a bulk() block is active"""
+        if not self._bulk_depth:
+            self.connection.commit()
+
+    @contextmanager
+    def _atomic(self):
+        """
+        Apply one write operation completely or not at all
+
+        Outside bulk() the operation commits, or rolls back on error.
+        Inside bulk() it runs under a SAVEPOINT that is rolled back on error,
+        leaving the rest of the block's writes in place.
+        """
+        if not self._bulk_depth:
+            try:
+                yield
+            except BaseException:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+            return
+
+        self.connection.execute("SAVEPOINT write_op")
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK TO write_op")
+            self.connection.execute("RELEASE write_op")
+            raise
+        self.connection.execute("RELEASE write_op")
+
     def create_tables(self):
         """Create all required database tables"""
         cursor = self.connection.cursor()
@@ -113,9 +286,9 @@ class DatabaseManager:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     transaction_date DATE NOT NULL,
                     amount REAL NOT NULL CHECK (amount > 0),
-                    from_type TEXT NOT NULL CHECK (from_type IN ('company', 'user')),
+                    from_type TEXT NOT NULL CHECK (from_type IN ('company', 'user', 'cash')),
                     from_id INTEGER NOT NULL,
-                    to_type TEXT NOT NULL CHECK (to_type IN ('company', 'user')),
+                    to_type TEXT NOT NULL CHECK (to_type IN ('company', 'user', 'cash')),
                     to_id INTEGER NOT NULL,
                     description TEXT,
                     reference TEXT,
@@ -132,22 +305,6 @@ class DatabaseManager:
                 )
             """)
 
-            # Create indexes for better performance
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_transactions_date
-                ON transactions(transaction_date)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_transactions_from
-                ON transactions(from_type, from_id)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_transactions_to
-                ON transactions(to_type, to_id)
-            """)
-
             self.connection.commit()
 
             # Insert default transaction types if table is empty
@@ -170,9 +327,160 @@ class DatabaseManager:
             self.connection.rollback()
             raise
 
-        # Run migrations
+        self.run_migrations()
+
+        # After the migrations - a table rebuild drops its indexes
+        self.create_indexes()
+
+    def create_indexes(self):
+        """Create indexes for better performance"""
+        cursor = self.connection.cursor()
+
+        # Matches the ORDER BY of the transaction lists, so pages are read
+        # in index order without a sort
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_transactions_date_created
+            ON transactions(transaction_date, created_date)
+        """)
+        # Superseded by the composite index above
+        cursor.execute("DROP INDEX IF EXISTS idx_transactions_date")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_transactions_from
+            ON transactions(from_type, from_id)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_transactions_to
+            ON transactions(to_type, to_id)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_transactions_reference
+            ON transactions(reference)
+        """)
+
+        # get_user_by_name (company names are already UNIQUE-indexed)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_users_name
+            ON users(name)
+        """)
+
+        self.connection.commit()
+
+    def run_migrations(self):
+        """
+        Bring an existing database up to SCHEMA_VERSION
+
+        The applied version is kept in PRAGMA user_version, so an up-to-date
+        database costs a single pragma read instead of parsing sqlite_master.
+        """
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            self._has_search_index = True
+            return
+
         self.migrate_remove_email_unique_constraint()
         self.migrate_add_cash_transaction_support()
+        self.migrate_round_amounts_to_paise()
+
+        # Full-text index is created last - the migrations above may rebuild tables
+        self.create_search_index()
+
+        # Without the search indexes, stay below 3 so they are retried next start
+        # (the other steps are idempotent)
+        new_version = SCHEMA_VERSION if self._has_search_index else 2
+        self.connection.execute(f"PRAGMA user_version = {new_version}")
+
+    def create_search_index(self):
+        """
+        Create the full-text indexes used by the search_* methods
+
+        Each table in SEARCH_INDEX_COLUMNS gets an FTS5 table with the trigram
+        tokenizer, so substring searches are answered from the index instead of
+        a LIKE '%...%' scan. Triggers keep the indexes in sync with their tables.
+        If this SQLite build lacks FTS5/trigram, searches fall back to LIKE.
+        """
+        cursor = self.connection.cursor()
+        self._has_search_index = False
+
+        try:
+            for table, columns in SEARCH_INDEX_COLUMNS.items():
+                fts = f"{table}_fts"
+                column_list = ", ".join(columns)
+                new_values = ", ".join(f"new.{column}" for column in columns)
+                old_values = ", ".join(f"old.{column}" for column in columns)
+
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name=?",
+                    (f"{fts}_ai",)
+                )
+                needs_rebuild = cursor.fetchone() is None
+
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                        {column_list},
+                        content='{table}', content_rowid='id',
+                        tokenize='trigram'
+                    )
+                """)
+
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                        INSERT INTO {fts} (rowid, {column_list})
+                        VALUES (new.id, {new_values});
+                    END
+                """)
+
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                        INSERT INTO {fts} ({fts}, rowid, {column_list})
+                        VALUES ('delete', old.id, {old_values});
+                    END
+                """)
+
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                        INSERT INTO {fts} ({fts}, rowid, {column_list})
+                        VALUES ('delete', old.id, {old_values});
+                        INSERT INTO {fts} (rowid, {column_list})
+                        VALUES (new.id, {new_values});
+                    END
+                """)
+
+                # New index, or triggers lost when a migration recreated the table
+                if needs_rebuild:
+                    cursor.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+            self.connection.commit()
+            self._has_search_index = True
+
+        except sqlite3.Error as e:
+            print(f"Search index unavailable, using LIKE search: {e}")
+            self.connection.rollback()
+
+    def _search_filter(self, table: str, search_term: str, alias: str = None):
+        """
+        Build the WHERE clause for a substring search on an indexed table
+
+        Args:
+            table: Table listed in SEARCH_INDEX_COLUMNS
+            search_term: Text to look for
+            alias: Table alias used in the surrounding query
+
+        Returns:
+            Tuple of (SQL condition, parameters)
+        """
+        prefix = f"{alias}." if alias else ""
+
+        # Trigram index needs at least 3 characters; shorter terms fall back to LIKE
+        if self._has_search_index and len(search_term) >= 3:
+            condition = f"{prefix}id IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)"
+            return condition, ('"' + search_term.replace('"', '""') + '"',)
+
+        columns = SEARCH_INDEX_COLUMNS[table]
+        condition = " OR ".join(f"{prefix}{column} LIKE ?" for column in columns)
+        return condition, (f"%{search_term}%",) * len(columns)
 
     def migrate_remove_email_unique_constraint(self):
         """
@@ -280,6 +588,28 @@ class DatabaseManager:
             # If migration fails, it's probably already migrated or a new database
             self.connection.rollback()
 
+    def migrate_round_amounts_to_paise(self):
+        """
+        Migration: round stored balances and amounts to whole paise
+
+        Older versions accumulated balances with plain float addition, which
+        can leave values such as 0.30000000000000004.
+        """
+        try:
+            self.connection.execute(
+                "UPDATE companies SET balance = ROUND(balance, 2) WHERE balance != ROUND(balance, 2)"
+            )
+            self.connection.execute(
+                "UPDATE users SET balance = ROUND(balance, 2) WHERE balance != ROUND(balance, 2)"
+            )
+            self.connection.execute(
+                "UPDATE transactions SET amount = ROUND(amount, 2) WHERE amount != ROUND(amount, 2)"
+            )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            print(f"Migration info: {e}")
+            self.connection.rollback()
+
     def execute_query(self, query: str, params: Tuple = ()) -> List[sqlite3.Row]:
         """
         Execute a SELECT query and return results
@@ -310,7 +640,7 @@ class DatabaseManager:
         cursor = self.connection.cursor()
         cursor.execute(query, params)
         if auto_commit:
-            self.connection.commit()
+            self._commit()
         return cursor.lastrowid if cursor.lastrowid else cursor.rowcount
 
     def execute_many(self, query: str, params_list: List[Tuple]) -> int:
@@ -326,7 +656,7 @@ class DatabaseManager:
         """
         cursor = self.connection.cursor()
         cursor.executemany(query, params_list)
-        self.connection.commit()
+        self._commit()
         return cursor.rowcount
 
     # ==================== Company Operations ====================
@@ -346,11 +676,16 @@ class DatabaseManager:
         results = self.execute_query(query, (company_id,))
         return dict(results[0]) if results else None
 
+    def get_company_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get company by exact name (uses the UNIQUE index on name)"""
+        query = "SELECT * FROM companies WHERE name = ? LIMIT 1"
+        results = self.execute_query(query, (name,))
+        return dict(results[0]) if results else None
+
     def get_all_companies(self) -> List[Dict[str, Any]]:
         """Get all companies"""
         query = "SELECT * FROM companies ORDER BY name"
-        results = self.execute_query(query)
-        return [dict(row) for row in results]
+        return self._cached_rows('companies', query)
 
     def update_company(self, company_id: int, name: str = None, address: str = None,
                        phone: str = None, email: str = None) -> int:
@@ -385,7 +720,7 @@ class DatabaseManager:
 
     def update_company_balance(self, company_id: int, amount: float, auto_commit: bool = True) -> int:
         """Update company balance by adding the specified amount"""
-        query = "UPDATE companies SET balance = balance + ? WHERE id = ?"
+        query = "UPDATE companies SET balance = ROUND(balance + ?, 2) WHERE id = ?"
         return self.execute_update(query, (amount, company_id), auto_commit)
 
     # ==================== User Operations ====================
@@ -399,17 +734,49 @@ class DatabaseManager:
         """
         return self.execute_update(query, (name, email, role, department, company_id))
 
+    def add_users_many(self, rows: List[Tuple]) -> List[int]:
+        """
+        Add many users in one database transaction
+
+        Args:
+            rows: Tuples of (name, email, role, department, company_id)
+
+        Returns:
+            IDs of the new users, in the order given
+        """
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return []
+
+        query = """
+            INSERT INTO users (name, email, role, department, company_id)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        # The savepoint undoes a partial batch even inside a caller's bulk() block
+        with self.bulk(), self._atomic():
+            self.execute_many(query, rows)
+            # The write lock is held, so the newest ids are the rows just added
+            new_ids = self.execute_query(
+                "SELECT id FROM users ORDER BY id DESC LIMIT ?", (len(rows),)
+            )
+        return [row['id'] for row in reversed(new_ids)]
+
     def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
         query = "SELECT * FROM users WHERE id = ?"
         results = self.execute_query(query, (user_id,))
         return dict(results[0]) if results else None
 
+    def get_user_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the first user with an exact name match"""
+        query = "SELECT * FROM users WHERE name = ? ORDER BY id LIMIT 1"
+        results = self.execute_query(query, (name,))
+        return dict(results[0]) if results else None
+
     def get_all_users(self) -> List[Dict[str, Any]]:
         """Get all users"""
         query = "SELECT * FROM users ORDER BY name"
-        results = self.execute_query(query)
-        return [dict(row) for row in results]
+        return self._cached_rows('users', query)
 
     def get_users_by_company(self, company_id: int) -> List[Dict[str, Any]]:
         """Get all users for a specific company"""
@@ -454,7 +821,7 @@ class DatabaseManager:
 
     def update_user_balance(self, user_id: int, amount: float, auto_commit: bool = True) -> int:
         """Update user balance by adding the specified amount"""
-        query = "UPDATE users SET balance = balance + ? WHERE id = ?"
+        query = "UPDATE users SET balance = ROUND(balance + ?, 2) WHERE id = ?"
         return self.execute_update(query, (amount, user_id), auto_commit)
 
     # ==================== Transaction Operations ====================
@@ -479,6 +846,7 @@ class DatabaseManager:
             Transaction ID
         """
         # Validate inputs
+        amount = round_paise(amount)
         if amount <= 0:
             raise ValueError("Transaction amount must be positive")
 
@@ -486,40 +854,86 @@ class DatabaseManager:
             raise ValueError("Transaction type must be 'company' or 'user'")
 
         try:
-            # Insert transaction (don't auto-commit)
-            query = """
-                INSERT INTO transactions
-                (transaction_date, amount, from_type, from_id, to_type, to_id,
-                 description, reference)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            transaction_id = self.execute_update(
-                query,
-                (transaction_date, amount, from_type, from_id, to_type, to_id,
-                 description, reference),
-                auto_commit=False
-            )
-
-            # Update sender balance (subtract) - don't auto-commit
-            if from_type == 'company':
-                self.update_company_balance(from_id, -amount, auto_commit=False)
-            else:
-                self.update_user_balance(from_id, -amount, auto_commit=False)
+            with self._atomic():
+                # Insert transaction (don't auto-commit)
+                query = """
+                    INSERT INTO transactions
+                    (transaction_date, amount, from_type, from_id, to_type, to_id,
+                     description, reference)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """
+                transaction_id = self.execute_update(
+                    query,
+                    (transaction_date, amount, from_type, from_id, to_type, to_id,
+                     description, reference),
+                    auto_commit=False
+                )
 
-            # Update receiver balance (add) - don't auto-commit
-            if to_type == 'company':
-                self.update_company_balance(to_id, amount, auto_commit=False)
-            else:
-                self.update_user_balance(to_id, amount, auto_commit=False)
+                # Update sender balance (subtract) - don't auto-commit
+                if from_type == 'company':
+                    self.update_company_balance(from_id, -amount, auto_commit=False)
+                else:
+                    self.update_user_balance(from_id, -amount, auto_commit=False)
 
-            # Commit all changes atomically
-            self.connection.commit()
+                # Update receiver balance (add) - don't auto-commit
+                if to_type == 'company':
+                    self.update_company_balance(to_id, amount, auto_commit=False)
+                else:
+                    self.update_user_balance(to_id, amount, auto_commit=False)
             return transaction_id
 
         except Exception as e:
-            self.connection.rollback()
             raise Exception(f"Failed to add transaction: {e}")
 
+    def add_transactions_many(self, rows: List[Tuple]) -> int:
+        """
+        Add many transactions and update balances in one database transaction
+
+        Args:
+            rows: Tuples of (transaction_date, amount, from_type, from_id,
+                  to_type, to_id, description, reference)
+
+        Returns:
+            Number of transactions added
+        """
+        rows = [(row[0], round_paise(row[1])) + tuple(row[2:]) for row in rows]
+        deltas = {}
+        for row in rows:
+            amount, from_type, from_id, to_type, to_id = row[1:6]
+            if amount <= 0:
+                raise ValueError("Transaction amount must be positive")
+            if from_type not in ['company', 'user'] or to_type not in ['company', 'user']:
+                raise ValueError("Transaction type must be 'company' or 'user'")
+            deltas[(from_type, from_id)] = deltas.get((from_type, from_id), 0) - amount
+            deltas[(to_type, to_id)] = deltas.get((to_type, to_id), 0) + amount
+
+        if not rows:
+            return 0
+
+        query = """
+            INSERT INTO transactions
+            (transaction_date, amount, from_type, from_id, to_type, to_id,
+             description, reference)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        try:
+            # The savepoint undoes a partial batch even inside a caller's bulk() block
+            with self.bulk(), self._atomic():
+                self.execute_many(query, rows)
+
+                # One balance update per affected entity, not per row
+                for entity_type, table in (('company', 'companies'), ('user', 'users')):
+                    updates = [(delta, entity_id) for (kind, entity_id), delta in deltas.items()
+                               if kind == entity_type]
+                    if updates:
+                        self.execute_many(
+                            f"UPDATE {table} SET balance = ROUND(balance + ?, 2) WHERE id = ?", updates
+                        )
+        except Exception as e:
+            raise Exception(f"Failed to add transactions: {e}")
+
+        return len(rows)
+
     def deposit(self, entity_type: str, entity_id: int, amount: float, description: str = "Cash Deposit") -> int:
         """
         Deposit money to an account (add balance)
@@ -533,6 +947,7 @@ class DatabaseManager:
         Returns:
             Transaction ID
         """
+        amount = round_paise(amount)
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
         
@@ -540,32 +955,29 @@ class DatabaseManager:
             raise ValueError("Entity type must be 'company' or 'user'")
         
         try:
-            # Create a transaction record for audit trail (don't auto-commit)
-            query = """
-                INSERT INTO transactions
-                (transaction_date, amount, from_type, from_id, to_type, to_id,
-                 description, reference)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            transaction_id = self.execute_update(
-                query,
-                (datetime.now().strftime('%d-%m-%Y'), amount, 'cash', 0, entity_type, entity_id,
-                 description, 'DEPOSIT'),
-                auto_commit=False
-            )
-
-            # Update balance (don't auto-commit)
-            if entity_type == 'company':
-                self.update_company_balance(entity_id, amount, auto_commit=False)
-            else:
-                self.update_user_balance(entity_id, amount, auto_commit=False)
+            with self._atomic():
+                # Create a transaction record for audit trail (don't auto-commit)
+                query = """
+                    INSERT INTO transactions
+                    (transaction_date, amount, from_type, from_id, to_type, to_id,
+                     description, reference)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """
+                transaction_id = self.execute_update(
+                    query,
+                    (get_current_date(), amount, 'cash', 0, entity_type, entity_id,
+                     description, 'DEPOSIT'),
+                    auto_commit=False
+                )
 
-            # Commit all changes atomically
-            self.connection.commit()
+                # Update balance (don't auto-commit)
+                if entity_type == 'company':
+                    self.update_company_balance(entity_id, amount, auto_commit=False)
+                else:
+                    self.update_user_balance(entity_id, amount, auto_commit=False)
             return transaction_id
 
         except Exception as e:
-            self.connection.rollback()
             raise Exception(f"Failed to deposit: {e}")
 
     def withdraw(self, entity_type: str, entity_id: int, amount: float, description: str = "Cash Withdrawal") -> int:
@@ -581,6 +993,7 @@ class DatabaseManager:
         Returns:
             Transaction ID
         """
+        amount = round_paise(amount)
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive")
         
@@ -600,32 +1013,29 @@ class DatabaseManager:
             raise Exception(f"Insufficient balance: {entity['balance']} < {amount}")
         
         try:
-            # Create a transaction record for audit trail (don't auto-commit)
-            query = """
-                INSERT INTO transactions
-                (transaction_date, amount, from_type, from_id, to_type, to_id,
-                 description, reference)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            transaction_id = self.execute_update(
-                query,
-                (datetime.now().strftime('%d-%m-%Y'), amount, entity_type, entity_id, 'cash', 0,
-                 description, 'WITHDRAW'),
-                auto_commit=False
-            )
-
-            # Update balance (don't auto-commit)
-            if entity_type == 'company':
-                self.update_company_balance(entity_id, -amount, auto_commit=False)
-            else:
-                self.update_user_balance(entity_id, -amount, auto_commit=False)
+            with self._atomic():
+                # Create a transaction record for audit trail (don't auto-commit)
+                query = """
+                    INSERT INTO transactions
+                    (transaction_date, amount, from_type, from_id, to_type, to_id,
+                     description, reference)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """
+                transaction_id = self.execute_update(
+                    query,
+                    (get_current_date(), amount, entity_type, entity_id, 'cash', 0,
+                     description, 'WITHDRAW'),
+                    auto_commit=False
+                )
 
-            # Commit all changes atomically
-            self.connection.commit()
+                # Update balance (don't auto-commit)
+                if entity_type == 'company':
+                    self.update_company_balance(entity_id, -amount, auto_commit=False)
+                else:
+                    self.update_user_balance(entity_id, -amount, auto_commit=False)
             return transaction_id
 
         except Exception as e:
-            self.connection.rollback()
             raise Exception(f"Failed to withdraw: {e}")
 
     def get_transaction(self, transaction_id: int) -> Optional[Dict[str, Any]]:
@@ -671,13 +1081,12 @@ class DatabaseManager:
             LEFT JOIN users u2 ON t.to_type = 'user' AND t.to_id = u2.id
             ORDER BY t.transaction_date DESC, t.created_date DESC
         """
+        params = ()
         if limit:
             # Use parameterized query to prevent SQL injection
             query += " LIMIT ?"
-            results = self.execute_query(query, (int(limit),))
-        else:
-            results = self.execute_query(query)
-        return [dict(row) for row in results]
+            params = (int(limit),)
+        return self._cached_rows('transactions', query, params)
 
     def get_transactions_paginated(self, page: int = 1, per_page: int = 50) -> tuple[List[Dict[str, Any]], int]:
         """
@@ -690,12 +1099,8 @@ class DatabaseManager:
         Returns:
             Tuple of (transactions list, total count)
         """
-        # Get total count
-        count_query = "SELECT COUNT(*) as count FROM transactions"
-        count_result = self.execute_query(count_query)
-        total_count = count_result[0]['count'] if count_result else 0
-
-        # Get paginated results
+        # The total rides along on every row as an uncorrelated subquery, which
+        # SQLite evaluates once - one statement instead of COUNT then SELECT
         offset = (page - 1) * per_page
         query = """
             SELECT
@@ -707,36 +1112,52 @@ class DatabaseManager:
                 CASE
                     WHEN t.to_type = 'company' THEN c2.name
                     ELSE u2.name
-                END as to_name
+                END as to_name,
+                (SELECT COUNT(*) FROM transactions) as total_count
             FROM transactions t
             LEFT JOIN companies c1 ON t.from_type = 'company' AND t.from_id = c1.id
             LEFT JOIN users u1 ON t.from_type = 'user' AND t.from_id = u1.id
             LEFT JOIN companies c2 ON t.to_type = 'company' AND t.to_id = c2.id
             LEFT JOIN users u2 ON t.to_type = 'user' AND t.to_id = u2.id
-            ORDER BY t.transaction_date DESC, t.created_date DESC
+            ORDER BY t.transaction_date DESC, t.created_date DESC, t.id DESC
             LIMIT ? OFFSET ?
         """
         results = self.execute_query(query, (per_page, offset))
-        return [dict(row) for row in results], total_count
-
-    def get_transaction_count(self) -> int:
-        """Get total number of transactions"""
-        query = "SELECT COUNT(*) as count FROM transactions"
-        result = self.execute_query(query)
-        return result[0]['count'] if result else 0
-
-    def search_transactions(self, search_term: str, limit: int = 100) -> List[Dict[str, Any]]:
+        if not results:
+            # Past the last page (or no transactions) - count separately
+            return [], self.get_transaction_count()
+
+        total_count = results[0]['total_count']
+        transactions = []
+        for row in results:
+            transaction = dict(row)
+            del transaction['total_count']
+            transactions.append(transaction)
+        return transactions, total_count
+
+    def get_transactions_keyset(self, cursor: Optional[Tuple] = None,
+                                limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[Tuple]]:
         """
-        Search transactions by description, from/to names
+        Get the next page of transactions after a cursor (keyset pagination)
+
+        Unlike get_transactions_paginated, the cost of a page does not grow
+        with its position: SQLite seeks straight to the cursor in
+        idx_transactions_date_created instead of skipping OFFSET rows.
 
         Args:
-            search_term: Search string
-            limit: Maximum results to return
+            cursor: Value returned with the previous page, or None for the first page
+            limit: Number of items per page
 
         Returns:
-            List of matching transactions
+            Tuple of (transactions list, cursor for the next page or None at the end)
         """
-        query = """
+        # created_date may be NULL (e.g. rows from old backups); NULL never compares
+        # in a row value, so '' stands in for it on both sides of the cursor
+        where = (
+            "WHERE (t.transaction_date, COALESCE(t.created_date, ''), t.id) < (?, ?, ?)"
+            if cursor else ""
+        )
+        query = f"""
             SELECT
                 t.*,
                 CASE
@@ -752,38 +1173,36 @@ class DatabaseManager:
             LEFT JOIN users u1 ON t.from_type = 'user' AND t.from_id = u1.id
             LEFT JOIN companies c2 ON t.to_type = 'company' AND t.to_id = c2.id
             LEFT JOIN users u2 ON t.to_type = 'user' AND t.to_id = u2.id
-            WHERE t.description LIKE ?
-               OR c1.name LIKE ?
-               OR u1.name LIKE ?
-               OR c2.name LIKE ?
-               OR u2.name LIKE ?
-            ORDER BY t.transaction_date DESC, t.created_date DESC
+            {where}
+            ORDER BY t.transaction_date DESC, COALESCE(t.created_date, '') DESC, t.id DESC
             LIMIT ?
         """
-        search_pattern = f"%{search_term}%"
-        results = self.execute_query(query, (search_pattern, search_pattern, search_pattern, search_pattern, search_pattern, limit))
-        return [dict(row) for row in results]
+        params = (*cursor, limit) if cursor else (limit,)
+        transactions = [dict(row) for row in self.execute_query(query, params)]
+
+        if len(transactions) < limit:
+            return transactions, None
+        last = transactions[-1]
+        return transactions, (last['transaction_date'], last['created_date'] or '', last['id'])
+
+    def get_transaction_count(self) -> int:
+        """Get total number of transactions"""
+        query = "SELECT COUNT(*) as count FROM transactions"
+        result = self.execute_query(query)
+        return result[0]['count'] if result else 0
 
     def search_companies(self, search_term: str) -> List[Dict[str, Any]]:
         """Search companies by name, email, or phone"""
-        query = """
-            SELECT * FROM companies
-            WHERE name LIKE ? OR email LIKE ? OR phone LIKE ?
-            ORDER BY name
-        """
-        search_pattern = f"%{search_term}%"
-        results = self.execute_query(query, (search_pattern, search_pattern, search_pattern))
+        condition, params = self._search_filter('companies', search_term)
+        query = f"SELECT * FROM companies WHERE {condition} ORDER BY name"
+        results = self.execute_query(query, params)
         return [dict(row) for row in results]
 
     def search_users(self, search_term: str) -> List[Dict[str, Any]]:
         """Search users by name, email, or department"""
-        query = """
-            SELECT * FROM users
-            WHERE name LIKE ? OR email LIKE ? OR department LIKE ?
-            ORDER BY name
-        """
-        search_pattern = f"%{search_term}%"
-        results = self.execute_query(query, (search_pattern, search_pattern, search_pattern))
+        condition, params = self._search_filter('users', search_term)
+        query = f"SELECT * FROM users WHERE {condition} ORDER BY name"
+        results = self.execute_query(query, params)
         return [dict(row) for row in results]
 
     def get_transactions_by_entity(self, entity_type: str, entity_id: int) -> List[Dict[str, Any]]:
@@ -822,44 +1241,53 @@ class DatabaseManager:
         Returns:
             List of transactions with type (Debit/Credit) and running balance
         """
-        # Get all transactions for this entity
-        transactions = self.get_transactions_by_entity(entity_type, entity_id)
-
-        # Sort by date (oldest first) to calculate running balance
-        transactions.sort(key=lambda x: (normalize_date_for_sort(x.get('transaction_date', '')), x.get('created_date', '')))
-        
-        # Get starting balance (should be 0 for new accounts)
-        if entity_type == 'company':
-            entity = self.get_company(entity_id)
-        else:
-            entity = self.get_user(entity_id)
-        
-        # Calculate running balance
-        running_balance = 0.0
+        # Running balance is accumulated by SQLite in date order (oldest first);
+        # rows come back newest first for display
+        query = """
+            SELECT * FROM (
+                SELECT
+                    t.*,
+                    CASE
+                        WHEN t.from_type = 'company' THEN c1.name
+                        ELSE u1.name
+                    END as from_name,
+                    CASE
+                        WHEN t.to_type = 'company' THEN c2.name
+                        ELSE u2.name
+                    END as to_name,
+                    ROUND(SUM(CASE WHEN t.to_type = ? AND t.to_id = ? THEN t.amount ELSE -t.amount END)
+                          OVER (ORDER BY normalize_date(t.transaction_date), t.created_date, t.id
+                                ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW), 2) as running_balance
+                FROM transactions t
+                LEFT JOIN companies c1 ON t.from_type = 'company' AND t.from_id = c1.id
+                LEFT JOIN users u1 ON t.from_type = 'user' AND t.from_id = u1.id
+                LEFT JOIN companies c2 ON t.to_type = 'company' AND t.to_id = c2.id
+                LEFT JOIN users u2 ON t.to_type = 'user' AND t.to_id = u2.id
+                WHERE (t.from_type = ? AND t.from_id = ?)
+                   OR (t.to_type = ? AND t.to_id = ?)
+            )
+            ORDER BY normalize_date(transaction_date) DESC, created_date DESC, id DESC
+        """
+        params = (entity_type, entity_id) * 3
         ledger_entries = []
-        
-        for trans in transactions:
+
+        for trans in self.execute_query(query, params):
             # Determine if this is a debit or credit for this account
-            is_credit = (trans['to_type'] == entity_type and trans['to_id'] == entity_id)
-            is_debit = (trans['from_type'] == entity_type and trans['from_id'] == entity_id)
-            
-            if is_credit:
+            if trans['to_type'] == entity_type and trans['to_id'] == entity_id:
                 # Money coming in (credit)
-                running_balance += trans['amount']
                 trans_type = 'Credit'
                 other_party = trans['from_name'] if trans['from_type'] != 'cash' else 'Cash Deposit'
                 other_party_type = trans['from_type']
                 other_party_id = trans['from_id']
             else:
                 # Money going out (debit)
-                running_balance -= trans['amount']
                 trans_type = 'Debit'
                 other_party = trans['to_name'] if trans['to_type'] != 'cash' else 'Cash Withdrawal'
                 other_party_type = trans['to_type']
                 other_party_id = trans['to_id']
 
             # Add ledger entry
-            ledger_entry = {
+            ledger_entries.append({
                 'id': trans['id'],
                 'date': trans['transaction_date'],
                 'type': trans_type,
@@ -869,18 +1297,14 @@ class DatabaseManager:
                 'other_party_type': other_party_type,
                 'other_party_id': other_party_id,
                 'amount': trans['amount'],
-                'running_balance': running_balance,
+                'running_balance': trans['running_balance'],
                 'from_name': trans['from_name'],
                 'to_name': trans['to_name'],
                 'from_type': trans['from_type'],
                 'to_type': trans['to_type'],
                 'created_date': trans['created_date']
-            }
-            ledger_entries.append(ledger_entry)
-        
-        # Reverse to show newest first
-        ledger_entries.reverse()
-        
+            })
+
         return ledger_entries
 
     def delete_transaction(self, transaction_id: int) -> int:
@@ -894,35 +1318,32 @@ class DatabaseManager:
             return 0
 
         try:
-            # Reverse balance changes
-            amount = transaction['amount']
-            from_type = transaction['from_type']
-            from_id = transaction['from_id']
-            to_type = transaction['to_type']
-            to_id = transaction['to_id']
-
-            # Reverse sender balance (add back) - don't auto-commit
-            if from_type == 'company':
-                self.update_company_balance(from_id, amount, auto_commit=False)
-            elif from_type == 'user':
-                self.update_user_balance(from_id, amount, auto_commit=False)
-
-            # Reverse receiver balance (subtract) - don't auto-commit
-            if to_type == 'company':
-                self.update_company_balance(to_id, -amount, auto_commit=False)
-            elif to_type == 'user':
-                self.update_user_balance(to_id, -amount, auto_commit=False)
-
-            # Delete transaction (don't auto-commit)
-            query = "DELETE FROM transactions WHERE id = ?"
-            result = self.execute_update(query, (transaction_id,), auto_commit=False)
-
-            # Commit all changes atomically
-            self.connection.commit()
+            with self._atomic():
+                # Reverse balance changes
+                amount = transaction['amount']
+                from_type = transaction['from_type']
+                from_id = transaction['from_id']
+                to_type = transaction['to_type']
+                to_id = transaction['to_id']
+
+                # Reverse sender balance (add back) - don't auto-commit
+                if from_type == 'company':
+                    self.update_company_balance(from_id, amount, auto_commit=False)
+                elif from_type == 'user':
+                    self.update_user_balance(from_id, amount, auto_commit=False)
+
+                # Reverse receiver balance (subtract) - don't auto-commit
+                if to_type == 'company':
+                    self.update_company_balance(to_id, -amount, auto_commit=False)
+                elif to_type == 'user':
+                    self.update_user_balance(to_id, -amount, auto_commit=False)
+
+                # Delete transaction (don't auto-commit)
+                query = "DELETE FROM transactions WHERE id = ?"
+                result = self.execute_update(query, (transaction_id,), auto_commit=False)
             return result
 
         except Exception as e:
-            self.connection.rollback()
             raise Exception(f"Failed to delete transaction: {e}")
 
     def delete_all_transactions(self) -> int:
@@ -931,21 +1352,19 @@ class DatabaseManager:
         WARNING: This will delete all transaction history and reset all account balances!
         """
         try:
-            # Reset all company balances to 0
-            self.connection.execute("UPDATE companies SET balance = 0.00")
-
-            # Reset all user balances to 0
-            self.connection.execute("UPDATE users SET balance = 0.00")
+            with self._atomic():
+                # Reset all company balances to 0
+                self.connection.execute("UPDATE companies SET balance = 0.00")
 
-            # Delete all transactions
-            result = self.connection.execute("DELETE FROM transactions")
-            deleted_count = result.rowcount
+                # Reset all user balances to 0
+                self.connection.execute("UPDATE users SET balance = 0.00")
 
-            self.connection.commit()
+                # Delete all transactions
+                result = self.connection.execute("DELETE FROM transactions")
+                deleted_count = result.rowcount
             return deleted_count
 
         except Exception as e:
-            self.connection.rollback()
             raise Exception(f"Failed to delete all transactions: {e}")
 
     def delete_multiple_transactions(self, transaction_ids: list) -> int:
@@ -958,41 +1377,39 @@ class DatabaseManager:
 
         deleted_count = 0
         try:
-            for transaction_id in transaction_ids:
-                # Get transaction details first
-                transaction = self.get_transaction(transaction_id)
-                if not transaction:
-                    continue
-
-                # Reverse balance changes
-                amount = transaction['amount']
-                from_type = transaction['from_type']
-                from_id = transaction['from_id']
-                to_type = transaction['to_type']
-                to_id = transaction['to_id']
-
-                # Reverse sender balance (add back)
-                if from_type == 'company':
-                    self.update_company_balance(from_id, amount)
-                elif from_type == 'user':
-                    self.update_user_balance(from_id, amount)
-
-                # Reverse receiver balance (subtract)
-                if to_type == 'company':
-                    self.update_company_balance(to_id, -amount)
-                elif to_type == 'user':
-                    self.update_user_balance(to_id, -amount)
-
-                # Delete transaction
-                query = "DELETE FROM transactions WHERE id = ?"
-                self.execute_update(query, (transaction_id,))
-                deleted_count += 1
-
-            self.connection.commit()
+            with self._atomic():
+                for transaction_id in transaction_ids:
+                    # Get transaction details first
+                    transaction = self.get_transaction(transaction_id)
+                    if not transaction:
+                        continue
+
+                    # Reverse balance changes
+                    amount = transaction['amount']
+                    from_type = transaction['from_type']
+                    from_id = transaction['from_id']
+                    to_type = transaction['to_type']
+                    to_id = transaction['to_id']
+
+                    # Reverse sender balance (add back) - don't auto-commit
+                    if from_type == 'company':
+                        self.update_company_balance(from_id, amount, auto_commit=False)
+                    elif from_type == 'user':
+                        self.update_user_balance(from_id, amount, auto_commit=False)
+
+                    # Reverse receiver balance (subtract) - don't auto-commit
+                    if to_type == 'company':
+                        self.update_company_balance(to_id, -amount, auto_commit=False)
+                    elif to_type == 'user':
+                        self.update_user_balance(to_id, -amount, auto_commit=False)
+
+                    # Delete transaction (don't auto-commit)
+                    query = "DELETE FROM transactions WHERE id = ?"
+                    self.execute_update(query, (transaction_id,), auto_commit=False)
+                    deleted_count += 1
             return deleted_count
 
         except Exception as e:
-            self.connection.rollback()
             raise Exception(f"Failed to delete transactions: {e}")
 
     # ==================== Reporting Operations ====================
@@ -1001,11 +1418,12 @@ class DatabaseManager:
         """Get total balances for companies and users"""
         cursor = self.connection.cursor()
 
-        cursor.execute("SELECT SUM(balance) FROM companies")
-        company_total = cursor.fetchone()[0] or 0.0
-
-        cursor.execute("SELECT SUM(balance) FROM users")
-        user_total = cursor.fetchone()[0] or 0.0
+        cursor.execute("""
+            SELECT
+                (SELECT COALESCE(SUM(balance), 0.0) FROM companies),
+                (SELECT COALESCE(SUM(balance), 0.0) FROM users)
+        """)
+        company_total, user_total = cursor.fetchone()
 
         return {
             'company_total': company_total,
@@ -1017,14 +1435,11 @@ class DatabaseManager:
         """Get transaction summary statistics"""
         cursor = self.connection.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM transactions")
-        total_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT SUM(amount) FROM transactions")
-        total_amount = cursor.fetchone()[0] or 0.0
-
-        cursor.execute("SELECT AVG(amount) FROM transactions")
-        avg_amount = cursor.fetchone()[0] or 0.0
+        # One scan for all three aggregates
+        cursor.execute("SELECT COUNT(*), SUM(amount), AVG(amount) FROM transactions")
+        total_count, total_amount, avg_amount = cursor.fetchone()
+        total_amount = total_amount or 0.0
+        avg_amount = avg_amount or 0.0
 
         return {
             'total_count': total_count,
@@ -1034,7 +1449,10 @@ class DatabaseManager:
 
     def search_transactions(self, search_term: str) -> List[Dict[str, Any]]:
         """Search transactions by description, reference, or entity names"""
-        query = """
+        search_pattern = f"%{search_term}%"
+        text_filter, text_params = self._search_filter('transactions', search_term, alias='t')
+
+        query = f"""
             SELECT
                 t.*,
                 CASE
@@ -1050,16 +1468,14 @@ class DatabaseManager:
             LEFT JOIN users u1 ON t.from_type = 'user' AND t.from_id = u1.id
             LEFT JOIN companies c2 ON t.to_type = 'company' AND t.to_id = c2.id
             LEFT JOIN users u2 ON t.to_type = 'user' AND t.to_id = u2.id
-            WHERE t.description LIKE ?
-               OR t.reference LIKE ?
+            WHERE {text_filter}
                OR c1.name LIKE ?
                OR u1.name LIKE ?
                OR c2.name LIKE ?
                OR u2.name LIKE ?
             ORDER BY t.transaction_date DESC
         """
-        search_pattern = f"%{search_term}%"
-        params = (search_pattern,) * 6
+        params = text_params + (search_pattern,) * 4
         results = self.execute_query(query, params)
         return [dict(row) for row in results]
 
@@ -1131,8 +1547,10 @@ class DatabaseManager:
             # Copy backup to database location
             shutil.copy2(backup_path, self.db_path)
 
-            # Reconnect
+            # Reconnect (the restored file may use an older schema)
             self.connect()
+            self._init_cache()
+            self.run_migrations()
 
             # Remove pre-restore backup on success
             if os.path.exists(current_backup):
@@ -1160,21 +1578,25 @@ class DatabaseManager:
         if backup_dir is None:
             backup_dir = os.path.dirname(self.db_path)
 
-        backups = []
-        for filename in os.listdir(backup_dir):
-            if filename.startswith('backup_') and filename.endswith('.db'):
-                filepath = os.path.join(backup_dir, filename)
-                stat = os.stat(filepath)
-                backups.append({
-                    'filename': filename,
-                    'path': filepath,
-                    'size': stat.st_size,
-                    'created': datetime.fromtimestamp(stat.st_mtime).strftime('%d-%m-%Y %H:%M:%S')
-                })
-
-        # Sort by creation date (newest first)
-        backups.sort(key=lambda x: x['created'], reverse=True)
-        return backups
+        # One directory scan - on Windows the entry stats come with the listing
+        with os.scandir(backup_dir) as entries:
+            found = [
+                (entry.stat().st_mtime, entry)
+                for entry in entries
+                if entry.name.startswith('backup_') and entry.name.endswith('.db')
+            ]
+
+        # Sort by modification time (newest first)
+        found.sort(key=lambda item: item[0], reverse=True)
+        return [
+            {
+                'filename': entry.name,
+                'path': entry.path,
+                'size': entry.stat().st_size,
+                'created': datetime.fromtimestamp(mtime).strftime('%d-%m-%Y %H:%M:%S')
+            }
+            for mtime, entry in found
+        ]
 
     def delete_backup(self, backup_path: str) -> bool:
         """
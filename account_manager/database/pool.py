@@ -0,0 +1,113 @@
+"""
+Connection Pool - Reusable SQLite connections shared across the process
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+# Applied once per file-backed connection when it is opened
+# (also used by DatabaseManager.connect)
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+class SQLitePool:
+    """Fixed-size pool of SQLite connections to a single database file"""
+
+    def __init__(self, db_path: str, size: int = 4):
+        """
+        Initialize connection pool
+
+        Args:
+            db_path: Path to SQLite database file
+            size: Number of connections to keep open
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.db_path = db_path
+        self.size = size
+        self.closed = False
+        self._connections = []
+        self._idle = queue.Queue(maxsize=size)
+
+        for _ in range(size):
+            connection = self._open()
+            self._connections.append(connection)
+            self._idle.put(connection)
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
+    def acquire_connection(self, timeout: float = None) -> sqlite3.Connection:
+        """Take a connection out of the pool (blocks until one is free)"""
+        return self._idle.get(timeout=timeout)
+
+    def release(self, connection: sqlite3.Connection):
+        """Return a connection to the pool, discarding any open transaction"""
+        if self.closed:
+            # Already closed along with the pool
+            return
+        if connection.in_transaction:
+            connection.rollback()
+        self._idle.put(connection)
+
+    @contextmanager
+    def acquire(self, timeout: float = None) -> Iterator[sqlite3.Connection]:
+        """Context manager that borrows a connection and returns it afterwards"""
+        connection = self.acquire_connection(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        """Close every connection owned by the pool and unregister it from get_pool"""
+        self.closed = True
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+
+        with _pools_lock:
+            if _pools.get(self.db_path) is self:
+                del _pools[self.db_path]
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str, size: int = 4) -> SQLitePool:
+    """
+    Get the process-wide pool for a database file, creating it on first use
+
+    Args:
+        db_path: Path to SQLite database file
+        size: Number of connections if the pool has to be created
+
+    Returns:
+        Shared SQLitePool instance
+    """
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None or pool.closed:
+            pool = _pools[db_path] = SQLitePool(db_path, size)
+        return pool
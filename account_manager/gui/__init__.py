@@ -1,3 +1,29 @@
 """
 GUI Module - CustomTkinter based user interface components
 """
+
+import importlib
+
+# Submodules are imported on first attribute access so that importing the
+# package (or anything next to it) does not load Tk/CustomTkinter up front
+_lazy = {
+    "MainWindow": ".main_window_tabbed",
+    "CompanyDialog": ".company_dialog",
+    "UserDialog": ".user_dialog",
+    "TransactionDialog": ".transaction_dialog",
+    "ReportsWindow": ".reports_window",
+    "LedgerWindow": ".ledger_window",
+    "BackupDialog": ".backup_dialog",
+    "CardFactory": ".card_components",
+}
+
+__all__ = list(_lazy)
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_lazy[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
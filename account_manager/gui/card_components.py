@@ -5,7 +5,9 @@ Reusable Card Components - Common UI card patterns for the application
 import customtkinter as ctk
 from typing import Dict, Any, Optional, Callable, List
 from utils.helpers import format_currency, format_date
-from utils.config import COLORS, FONTS, SIZES, get_balance_color
+from utils.config import (
+    COLORS, SIZES, CARD_TITLE_FONT, CARD_SUBTITLE_FONT, CARD_DETAIL_FONT, get_balance_color
+)
 
 
 class CardFactory:
@@ -48,7 +50,7 @@ class CardFactory:
         name_label = ctk.CTkLabel(
             content,
             text=name,
-            font=FONTS['card_title'],
+            font=CARD_TITLE_FONT,
             anchor="w"
         )
         name_label.pack(anchor="w")
@@ -62,7 +64,7 @@ class CardFactory:
         balance_label = ctk.CTkLabel(
             content,
             text=f"Balance: {balance_text}",
-            font=FONTS['card_subtitle'],
+            font=CARD_SUBTITLE_FONT,
             text_color=balance_color,
             anchor="w"
         )
@@ -77,7 +79,7 @@ class CardFactory:
                 detail_label = ctk.CTkLabel(
                     content,
                     text=detail_text,
-                    font=FONTS['card_detail'],
+                    font=CARD_DETAIL_FONT,
                     text_color=COLORS['text_secondary'],
                     anchor="w"
                 )
@@ -34,6 +34,7 @@ class LedgerWindow(ctk.CTkToplevel):
         self.view_mode = "grouped"  # "grouped" or "chronological"
         self.expanded_groups = set()  # Track which groups are expanded
         self.sort_order = "desc"  # "desc" (newest first) or "asc" (oldest first)
+        self._ledger_entries = None  # Fetched once; view/sort/expand changes only re-render
 
         # Window setup
         self.title(f"Ledger - {entity_name}")
@@ -221,9 +222,11 @@ class LedgerWindow(ctk.CTkToplevel):
         for widget in self.scroll_frame.winfo_children():
             widget.destroy()
 
-        # Get ledger entries
+        # Get ledger entries (names and running balances come back in the same query)
         try:
-            ledger_entries = self.db.get_account_ledger(self.entity_type, self.entity_id)
+            if self._ledger_entries is None:
+                self._ledger_entries = self.db.get_account_ledger(self.entity_type, self.entity_id)
+            ledger_entries = list(self._ledger_entries)
 
             if not ledger_entries:
                 # No transactions
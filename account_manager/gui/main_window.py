@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 from database.db_manager import DatabaseManager
-from utils.helpers import format_currency, format_date, validate_amount, get_current_date
+from utils.helpers import clean_amount_text, format_currency, format_indian, format_date, validate_amount, get_current_date
 
 
 class MainWindow:
@@ -42,7 +42,7 @@ class MainWindow:
             current_value = self.amount_entry.get()
 
             # Remove all non-numeric characters except decimal point
-            clean_value = ''.join(c for c in current_value if c.isdigit() or c == '.')
+            clean_value = clean_amount_text(current_value)
 
             if not clean_value or clean_value == '.':
                 return
@@ -60,22 +60,7 @@ class MainWindow:
 
             # Format integer part in Indian style
             if integer_part:
-                # Reverse the string for easier grouping
-                reversed_num = integer_part[::-1]
-
-                # First group of 3, then groups of 2
-                groups = []
-                groups.append(reversed_num[:3])  # First 3 digits
-                remaining = reversed_num[3:]
-
-                # Add groups of 2
-                while remaining:
-                    groups.append(remaining[:2])
-                    remaining = remaining[2:]
-
-                # Join groups with comma and reverse back
-                formatted = ','.join(groups)
-                formatted = formatted[::-1]
+                formatted = format_indian(integer_part)
             else:
                 formatted = '0'
 
@@ -83,6 +68,10 @@ class MainWindow:
             if decimal_part or '.' in current_value:
                 formatted = f"{formatted}.{decimal_part}"
 
+            # Nothing to do if the text is already formatted (e.g. arrow/shift keys)
+            if formatted == current_value:
+                return
+
             # Calculate new cursor position
             # Count commas before old cursor position
             commas_before = current_value[:cursor_pos].count(',')
@@ -416,7 +405,7 @@ class MainWindow:
             cursor_pos = self.dw_amount_entry.index("insert")
             current_value = self.dw_amount_entry.get()
             
-            clean_value = ''.join(c for c in current_value if c.isdigit() or c == '.')
+            clean_value = clean_amount_text(current_value)
             
             if not clean_value or clean_value == '.':
                 return
@@ -430,23 +419,17 @@ class MainWindow:
                 decimal_part = ''
             
             if integer_part:
-                reversed_num = integer_part[::-1]
-                groups = []
-                groups.append(reversed_num[:3])
-                remaining = reversed_num[3:]
-                
-                while remaining:
-                    groups.append(remaining[:2])
-                    remaining = remaining[2:]
-                
-                formatted = ','.join(groups)
-                formatted = formatted[::-1]
+                formatted = format_indian(integer_part)
             else:
                 formatted = '0'
             
             if decimal_part or '.' in current_value:
                 formatted = f"{formatted}.{decimal_part}"
             
+            # Nothing to do if the text is already formatted (e.g. arrow/shift keys)
+            if formatted == current_value:
+                return
+
             commas_before = current_value[:cursor_pos].count(',')
             clean_cursor_pos = cursor_pos - commas_before
             
@@ -766,15 +749,11 @@ class MainWindow:
 
         # Find entity ID by name
         if entity_type == "company":
-            companies = self.db.get_all_companies()
-            for company in companies:
-                if company['name'] == name_part:
-                    return entity_type, company['id'], company['name']
+            entity = self.db.get_company_by_name(name_part)
         else:
-            users = self.db.get_all_users()
-            for user in users:
-                if user['name'] == name_part:
-                    return entity_type, user['id'], user['name']
+            entity = self.db.get_user_by_name(name_part)
+        if entity:
+            return entity_type, entity['id'], entity['name']
 
         return None, None, None
 
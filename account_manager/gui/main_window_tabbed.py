@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 from database.db_manager import DatabaseManager
-from utils.helpers import format_currency, format_date, validate_amount, get_current_date, validate_email, normalize_date_for_sort, validate_name, validate_phone, handle_error, show_success, show_warning, confirm_action
+from utils.helpers import clean_amount_text, format_currency, format_indian, format_date, validate_amount, get_current_date, validate_email, normalize_date_for_sort, validate_name, validate_phone, handle_error, show_success, show_warning, confirm_action
 from utils.config import COLORS, FONTS, SIZES, get_balance_color
 from gui.company_dialog import CompanyDialog
 from gui.user_dialog import UserDialog
@@ -709,11 +709,9 @@ class MainWindow:
         company_id = None
         company_name = self.user_company_combo.get()
         if company_name and company_name != "None":
-            companies = self.db.get_all_companies()
-            for company in companies:
-                if company['name'] == company_name:
-                    company_id = company['id']
-                    break
+            company = self.db.get_company_by_name(company_name)
+            if company:
+                company_id = company['id']
 
         # Add to database
         try:
@@ -758,11 +756,9 @@ class MainWindow:
         company_id = None
         company_name = self.user_company_combo.get()
         if company_name and company_name != "None":
-            companies = self.db.get_all_companies()
-            for company in companies:
-                if company['name'] == company_name:
-                    company_id = company['id']
-                    break
+            company = self.db.get_company_by_name(company_name)
+            if company:
+                company_id = company['id']
 
         # Update in database
         try:
@@ -1414,7 +1410,7 @@ class MainWindow:
         elif trans['from_type'] == 'user':
             from_initial = f"[User] {trans['from_name']}"
             # Add company info if user has one
-            from_user = next((u for u in self.db.get_all_users() if u['name'] == trans['from_name']), None)
+            from_user = self.db.get_user(trans['from_id'])
             if from_user and from_user.get('company_id'):
                 from_company = self.db.get_company(from_user['company_id'])
                 if from_company:
@@ -1441,7 +1437,7 @@ class MainWindow:
         elif trans['to_type'] == 'user':
             to_initial = f"[User] {trans['to_name']}"
             # Add company info if user has one
-            to_user = next((u for u in self.db.get_all_users() if u['name'] == trans['to_name']), None)
+            to_user = self.db.get_user(trans['to_id'])
             if to_user and to_user.get('company_id'):
                 to_company = self.db.get_company(to_user['company_id'])
                 if to_company:
@@ -2002,7 +1998,7 @@ class MainWindow:
         try:
             cursor_pos = self.amount_entry.index("insert")
             current_value = self.amount_entry.get()
-            clean_value = ''.join(c for c in current_value if c.isdigit() or c == '.')
+            clean_value = clean_amount_text(current_value)
 
             if not clean_value or clean_value == '.':
                 return
@@ -2016,21 +2012,17 @@ class MainWindow:
                 decimal_part = ''
 
             if integer_part:
-                reversed_num = integer_part[::-1]
-                groups = [reversed_num[:3]]
-                remaining = reversed_num[3:]
-
-                while remaining:
-                    groups.append(remaining[:2])
-                    remaining = remaining[2:]
-
-                formatted = ','.join(groups)[::-1]
+                formatted = format_indian(integer_part)
             else:
                 formatted = '0'
 
             if decimal_part or '.' in current_value:
                 formatted = f"{formatted}.{decimal_part}"
 
+            # Nothing to do if the text is already formatted (e.g. arrow/shift keys)
+            if formatted == current_value:
+                return
+
             commas_before = current_value[:cursor_pos].count(',')
             clean_cursor_pos = cursor_pos - commas_before
 
@@ -2063,7 +2055,7 @@ class MainWindow:
         try:
             cursor_pos = self.trans_detail_amount_entry.index("insert")
             current_value = self.trans_detail_amount_entry.get()
-            clean_value = ''.join(c for c in current_value if c.isdigit() or c == '.')
+            clean_value = clean_amount_text(current_value)
 
             if not clean_value or clean_value == '.':
                 return
@@ -2077,21 +2069,17 @@ class MainWindow:
                 decimal_part = ''
 
             if integer_part:
-                reversed_num = integer_part[::-1]
-                groups = [reversed_num[:3]]
-                remaining = reversed_num[3:]
-
-                while remaining:
-                    groups.append(remaining[:2])
-                    remaining = remaining[2:]
-
-                formatted = ','.join(groups)[::-1]
+                formatted = format_indian(integer_part)
             else:
                 formatted = '0'
 
             if decimal_part or '.' in current_value:
                 formatted = f"{formatted}.{decimal_part}"
 
+            # Nothing to do if the text is already formatted (e.g. arrow/shift keys)
+            if formatted == current_value:
+                return
+
             commas_before = current_value[:cursor_pos].count(',')
             clean_cursor_pos = cursor_pos - commas_before
 
@@ -2181,17 +2169,12 @@ class MainWindow:
 
     def load_balance_data(self):
         """Load balance overview"""
-        # Get company balances
-        companies = self.db.get_all_companies()
-        company_total = sum(c['balance'] for c in companies)
-
-        # Get user balances
-        users = self.db.get_all_users()
-        user_total = sum(u['balance'] for u in users)
+        # Totals are summed by SQLite - no need to load every account
+        balances = self.db.get_total_balances()
 
         # Update labels
-        self.company_balance_label.configure(text=format_currency(company_total))
-        self.user_balance_label.configure(text=format_currency(user_total))
+        self.company_balance_label.configure(text=format_currency(balances['company_total']))
+        self.user_balance_label.configure(text=format_currency(balances['user_total']))
 
     def load_accounts_list(self):
         """Load clickable accounts list"""
@@ -2324,15 +2307,11 @@ class MainWindow:
 
         # Find entity by name
         if entity_type == "company":
-            companies = self.db.get_all_companies()
-            for company in companies:
-                if company['name'] == name_part:
-                    return entity_type, company['id'], company['name']
+            entity = self.db.get_company_by_name(name_part)
         else:
-            users = self.db.get_all_users()
-            for user in users:
-                if user['name'] == name_part:
-                    return entity_type, user['id'], user['name']
+            entity = self.db.get_user_by_name(name_part)
+        if entity:
+            return entity_type, entity['id'], entity['name']
 
         return None, None, None
 
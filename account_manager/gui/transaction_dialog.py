@@ -24,6 +24,10 @@ class TransactionDialog:
         self.parent = parent
         self.db = db
         self.selected_transaction_id = None
+        self._selected_trans = None
+        self._card_by_id = {}
+        # Search currently shown in the list (None when showing everything)
+        self._search_term = None
 
         # Create dialog window
         self.dialog = ctk.CTkToplevel(parent)
@@ -253,9 +257,12 @@ class TransactionDialog:
 
     def load_transactions(self):
         """Load and display all transactions"""
+        self._search_term = None
+
         # Clear existing list
         for widget in self.trans_list.winfo_children():
             widget.destroy()
+        self._card_by_id.clear()
 
         # Get transactions
         transactions = self.db.get_all_transactions()
@@ -281,6 +288,7 @@ class TransactionDialog:
         """Create a transaction display card"""
         card = ctk.CTkFrame(self.trans_list, corner_radius=8)
         card.pack(fill="x", pady=5, padx=5)
+        self._card_by_id[trans['id']] = card
 
         # Make card clickable
         card.bind("<Button-1>", lambda e, t=trans: self.select_transaction(t))
@@ -356,45 +364,51 @@ class TransactionDialog:
     def select_transaction(self, trans: Dict[str, Any]):
         """Select a transaction to view details"""
         self.selected_transaction_id = trans['id']
+        self._selected_trans = trans
 
-        # Populate details
-        self.detail_id.configure(text=str(trans['id']))
-
+        # Populate details - one configure per label, applied in a single pass
         date_text = format_date(trans['transaction_date'], "%d-%m-%Y", "%d %B, %Y")
-        self.detail_date.configure(text=date_text)
+        from_type = trans['from_type'].capitalize()
+        to_type = trans['to_type'].capitalize()
+
+        detail_texts = (
+            (self.detail_id, str(trans['id'])),
+            (self.detail_date, date_text),
+            (self.detail_from, f"{trans['from_name']} ({from_type})"),
+            (self.detail_to, f"{trans['to_name']} ({to_type})"),
+            (self.detail_type, f"{from_type} to {to_type}"),
+            (self.detail_desc, trans.get('description', '--')),
+            (self.detail_ref, trans.get('reference', '--')),
+        )
+        for label, text in detail_texts:
+            label.configure(text=text)
 
         self.detail_amount.configure(
             text=format_currency(trans['amount']),
             text_color="green"
         )
 
-        from_text = f"{trans['from_name']} ({trans['from_type'].capitalize()})"
-        self.detail_from.configure(text=from_text)
-
-        to_text = f"{trans['to_name']} ({trans['to_type'].capitalize()})"
-        self.detail_to.configure(text=to_text)
-
-        type_text = f"{trans['from_type'].capitalize()} to {trans['to_type'].capitalize()}"
-        self.detail_type.configure(text=type_text)
-
-        self.detail_desc.configure(text=trans.get('description', '--'))
-        self.detail_ref.configure(text=trans.get('reference', '--'))
-
         # Enable update and delete buttons
-        self.update_btn.configure(state="normal")
-        self.delete_btn.configure(state="normal")
+        for button in (self.update_btn, self.delete_btn):
+            button.configure(state="normal")
+
+        # Flush the queued redraws as a single layout pass
+        self.dialog.update_idletasks()
 
-    def search_transactions(self):
-        """Search transactions by keyword"""
-        search_term = self.search_entry.get().strip()
+    def search_transactions(self, search_term: str = None):
+        """Search transactions by keyword (the search box text by default)"""
+        if search_term is None:
+            search_term = self.search_entry.get().strip()
 
         if not search_term:
             self.load_transactions()
             return
+        self._search_term = search_term
 
         # Clear existing list
         for widget in self.trans_list.winfo_children():
             widget.destroy()
+        self._card_by_id.clear()
 
         # Search
         transactions = self.db.search_transactions(search_term)
@@ -416,13 +430,21 @@ class TransactionDialog:
         for trans in transactions:
             self.create_transaction_card(trans)
 
+    def refresh_transactions(self):
+        """Reload the list, keeping the active search if there is one"""
+        if self._search_term:
+            self.search_transactions(self._search_term)
+        else:
+            self.load_transactions()
+
     def delete_transaction(self):
         """Delete selected transaction"""
         if not self.selected_transaction_id:
             messagebox.showerror("Error", "No transaction selected")
             return
 
-        trans = self.db.get_transaction(self.selected_transaction_id)
+        # Row was cached when selected; no need to hit the database again
+        trans = self._selected_trans
         if not trans:
             messagebox.showerror("Error", "Transaction not found")
             return
@@ -444,18 +466,35 @@ class TransactionDialog:
         # Delete from database
         try:
             self.db.delete_transaction(self.selected_transaction_id)
-            messagebox.showinfo("Success", "Transaction deleted successfully!")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete transaction: {str(e)}")
+            return
 
-            # Clear selection
-            self.selected_transaction_id = None
-            self.update_btn.configure(state="disabled")
-            self.delete_btn.configure(state="disabled")
+        messagebox.showinfo("Success", "Transaction deleted successfully!")
 
-            # Refresh list
-            self.load_transactions()
+        # Remove only the deleted card instead of rebuilding the whole list
+        try:
+            self.remove_transaction_card(self.selected_transaction_id)
+        except Exception:
+            self.refresh_transactions()
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete transaction: {str(e)}")
+        # Clear selection
+        self.selected_transaction_id = None
+        self._selected_trans = None
+        self.update_btn.configure(state="disabled")
+        self.delete_btn.configure(state="disabled")
+
+    def remove_transaction_card(self, transaction_id: int):
+        """Destroy a single transaction card and update the count label"""
+        self._card_by_id.pop(transaction_id).destroy()
+
+        if not self._card_by_id:
+            # Last card gone - show the empty state of the current view
+            self.refresh_transactions()
+            return
+
+        count_text, _, suffix = self.count_label.cget("text").partition(" ")
+        self.count_label.configure(text=f"{int(count_text) - 1} {suffix}")
 
     def update_transaction(self):
         """Open dialog to update selected transaction"""
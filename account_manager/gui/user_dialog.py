@@ -24,6 +24,10 @@ class UserDialog:
         self.parent = parent
         self.db = db
         self.selected_user_id = None
+        self._selected_user = None
+        self._card_by_id = {}
+        # Company names last given to the dropdown (None until first load)
+        self._last_company_vals = None
 
         # Create dialog window
         self.dialog = ctk.CTkToplevel(parent)
@@ -192,8 +196,12 @@ class UserDialog:
     def load_companies(self):
         """Load companies into dropdown"""
         companies = self.db.get_all_companies()
-        company_names = ["None"] + [c['name'] for c in companies]
-        self.company_combo.configure(values=company_names)
+        company_names = ("None",) + tuple(c['name'] for c in companies)
+
+        # Only rebuild the dropdown menu when the company list actually changed
+        if self._last_company_vals != company_names:
+            self.company_combo.configure(values=list(company_names))
+            self._last_company_vals = company_names
         self.company_combo.set("None")
 
     def load_users(self):
@@ -201,6 +209,7 @@ class UserDialog:
         # Clear existing list
         for widget in self.user_list.winfo_children():
             widget.destroy()
+        self._card_by_id.clear()
 
         # Get users
         users = self.db.get_all_users()
@@ -223,6 +232,7 @@ class UserDialog:
         """Create a user display card"""
         card = ctk.CTkFrame(self.user_list, corner_radius=8)
         card.pack(fill="x", pady=5, padx=5)
+        self._card_by_id[user['id']] = card
 
         # Make card clickable
         card.bind("<Button-1>", lambda e, u=user: self.select_user(u))
@@ -295,6 +305,7 @@ class UserDialog:
     def select_user(self, user: Dict[str, Any]):
         """Select a user to edit"""
         self.selected_user_id = user['id']
+        self._selected_user = user
 
         # Populate form
         self.name_entry.delete(0, "end")
@@ -345,11 +356,9 @@ class UserDialog:
         company_id = None
         company_name = self.company_combo.get()
         if company_name and company_name != "None":
-            companies = self.db.get_all_companies()
-            for company in companies:
-                if company['name'] == company_name:
-                    company_id = company['id']
-                    break
+            company = self.db.get_company_by_name(company_name)
+            if company:
+                company_id = company['id']
 
         # Add to database
         try:
@@ -393,11 +402,9 @@ class UserDialog:
         company_id = None
         company_name = self.company_combo.get()
         if company_name and company_name != "None":
-            companies = self.db.get_all_companies()
-            for company in companies:
-                if company['name'] == company_name:
-                    company_id = company['id']
-                    break
+            company = self.db.get_company_by_name(company_name)
+            if company:
+                company_id = company['id']
 
         # Update in database
         try:
@@ -423,7 +430,8 @@ class UserDialog:
             messagebox.showerror("Error", "No user selected")
             return
 
-        user = self.db.get_user(self.selected_user_id)
+        # Row was cached when selected; no need to hit the database again
+        user = self._selected_user
         if not user:
             messagebox.showerror("Error", "User not found")
             return
@@ -439,16 +447,26 @@ class UserDialog:
         # Delete from database
         try:
             self.db.delete_user(self.selected_user_id)
-            messagebox.showinfo("Success", f"User '{user['name']}' deleted successfully!")
-            self.clear_form()
-            self.load_users()
-
         except Exception as e:
             messagebox.showerror("Error", f"Failed to delete user: {str(e)}")
+            return
+
+        messagebox.showinfo("Success", f"User '{user['name']}' deleted successfully!")
+
+        # Remove only the deleted card instead of rebuilding the whole list
+        try:
+            self._card_by_id.pop(self.selected_user_id).destroy()
+            if not self._card_by_id:
+                self.load_users()
+        except Exception:
+            self.load_users()
+
+        self.clear_form()
 
     def clear_form(self):
         """Clear form and reset selection"""
         self.selected_user_id = None
+        self._selected_user = None
 
         self.name_entry.delete(0, "end")
         self.email_entry.delete(0, "end")
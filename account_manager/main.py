@@ -5,19 +5,12 @@ A modern desktop application for managing financial transactions
 
 import sys
 import os
+import threading
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    import customtkinter as ctk
-except ImportError:
-    print("ERROR: CustomTkinter is not installed!")
-    print("Please install it using: pip install customtkinter")
-    sys.exit(1)
-
 from database.db_manager import DatabaseManager
-from gui.main_window_tabbed import MainWindow
 
 
 class AccountManagerApp:
@@ -25,9 +18,11 @@ class AccountManagerApp:
 
     def __init__(self):
         """Initialize the application"""
-        # Set CustomTkinter appearance and theme
-        ctk.set_appearance_mode("dark")  # Options: "dark", "light", "system"
-        ctk.set_default_color_theme("blue")  # Options: "blue", "dark-blue", "green"
+        # Tk/CustomTkinter and the GUI modules are imported here rather than at
+        # module level so that importing main.py does not pay the Tk start-up cost.
+        # The imports start on a worker thread so they overlap the database setup.
+        preload = threading.Thread(target=self._preload_gui, daemon=True)
+        preload.start()
 
         # Initialize database
         try:
@@ -37,6 +32,23 @@ class AccountManagerApp:
             print(f"Error initializing database: {e}")
             sys.exit(1)
 
+        # Already in sys.modules once the worker finishes
+        preload.join()
+        try:
+            import customtkinter as ctk
+        except ImportError:
+            print("ERROR: CustomTkinter is not installed!")
+            print("Please install it using: pip install customtkinter")
+            sys.exit(1)
+
+        from gui.main_window_tabbed import MainWindow
+
+        self.ctk = ctk
+
+        # Set CustomTkinter appearance and theme
+        ctk.set_appearance_mode("dark")  # Options: "dark", "light", "system"
+        ctk.set_default_color_theme("blue")  # Options: "blue", "dark-blue", "green"
+
         # Create main window
         self.root = ctk.CTk()
         self.root.title("Account Manager")
@@ -51,10 +63,19 @@ class AccountManagerApp:
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    @staticmethod
+    def _preload_gui():
+        """Import the GUI modules in the background (no widgets are created here)"""
+        try:
+            import customtkinter
+            import gui.main_window_tabbed
+        except ImportError:
+            # Reported on the main thread, which repeats the import
+            pass
+
     def run(self):
         """Run the application"""
-        print("Starting Account Manager...")
-        print(f"Theme: {ctk.get_appearance_mode()}")
+        print(f"Starting Account Manager...\nTheme: {self.ctk.get_appearance_mode()}")
         self.root.mainloop()
 
     def on_closing(self):
@@ -71,10 +92,13 @@ class AccountManagerApp:
 
 def main():
     """Main entry point"""
-    print("=" * 50)
-    print("Account Manager v1.0.0")
-    print("Modern Financial Transaction Management")
-    print("=" * 50)
+    # One write for the whole banner - console output is slow on Windows
+    print("\n".join((
+        "=" * 50,
+        "Account Manager v1.0.0",
+        "Modern Financial Transaction Management",
+        "=" * 50,
+    )))
 
     # Create and run application
     app = AccountManagerApp()
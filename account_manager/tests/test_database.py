@@ -6,28 +6,100 @@ import unittest
 import tempfile
 import os
 import sys
+import sqlite3
+from unittest import mock
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path (once - a test runner may already have it)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
 
-from database.db_manager import DatabaseManager
+from database.db_manager import DatabaseManager, SCHEMA_VERSION
+from database.pool import SQLitePool, get_pool
 
 
-class TestDatabaseManager(unittest.TestCase):
-    """Test cases for DatabaseManager"""
+class DatabaseTestCase(unittest.TestCase):
+    """Base class that opens the schema once and hands each test a copy"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the schema once; every test starts from a copy of it"""
+        cls.template_db = DatabaseManager(':memory:')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.template_db.close()
 
     def setUp(self):
         """Set up test database"""
-        self.temp_dir = tempfile.mkdtemp()
+        # In-memory copy of the template: no schema setup, file I/O or fsync
+        # per test. Tests that need a real file use open_file_db().
+        self._tmp = tempfile.TemporaryDirectory()
+        self.temp_dir = self._tmp.name
         self.db_path = os.path.join(self.temp_dir, 'test.db')
-        self.db = DatabaseManager(self.db_path)
+        self.connection = sqlite3.connect(':memory:')
+        self.template_db.connection.backup(self.connection)
+        self.db = DatabaseManager(conn=self.connection)
 
     def tearDown(self):
         """Clean up test database"""
         self.db.close()
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+        self.connection.close()
+        self._tmp.cleanup()
+
+    def open_file_db(self):
+        """Replace the in-memory database with one stored at self.db_path"""
+        self.db.close()
+        self.db = DatabaseManager(self.db_path)
+
+
+class TestDatabaseManager(DatabaseTestCase):
+    """Test cases for DatabaseManager"""
+
+    # Schema Tests
+    def test_schema_version(self):
+        """Test that the schema version is recorded and survives reopening"""
+        self.open_file_db()
+        version = self.db.connection.execute("PRAGMA user_version").fetchone()[0]
+        self.assertEqual(version, SCHEMA_VERSION)
+
+        self.db.close()
+        self.db = DatabaseManager(self.db_path)
+        self.assertTrue(self.db._has_search_index)
+
+    def test_migrate_old_transactions_schema(self):
+        """Test that a database without 'cash' support is migrated on open"""
+        self.db.close()
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE transactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                transaction_date DATE NOT NULL,
+                amount REAL NOT NULL CHECK (amount > 0),
+                from_type TEXT NOT NULL CHECK (from_type IN ('company', 'user')),
+                from_id INTEGER NOT NULL,
+                to_type TEXT NOT NULL CHECK (to_type IN ('company', 'user')),
+                to_id INTEGER NOT NULL,
+                description TEXT,
+                reference TEXT,
+                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        self.db = DatabaseManager(self.db_path)
+        user_id = self.db.add_user("Test User")
+        self.db.deposit("user", user_id, 50.0)
+        self.assertEqual(self.db.get_user(user_id)['balance'], 50.0)
+
+        # Indexes are rebuilt on the migrated table
+        indexes = {row[0] for row in self.db.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'transactions'"
+        )}
+        self.assertIn('idx_transactions_from', indexes)
+        self.assertIn('idx_transactions_date_created', indexes)
 
     # Company Tests
     def test_add_company(self):
@@ -43,6 +115,12 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIsNotNone(company)
         self.assertEqual(company['name'], "Test Company")
 
+    def test_get_company_by_name(self):
+        """Test retrieving a company by exact name"""
+        company_id = self.db.add_company("Test Company")
+        self.assertEqual(self.db.get_company_by_name("Test Company")['id'], company_id)
+        self.assertIsNone(self.db.get_company_by_name("Test"))
+
     def test_update_company(self):
         """Test updating a company"""
         company_id = self.db.add_company("Test Company")
@@ -71,6 +149,38 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIsNotNone(user_id)
         self.assertGreater(user_id, 0)
 
+    def test_add_users_many(self):
+        """Test batch user creation, including blank and repeated emails"""
+        company_id = self.db.add_company("Test Company")
+        self.db.add_user("Existing User")
+
+        rows = [
+            ("User A", "", "", "", None),
+            ("User B", "", "Dev", "IT", company_id),
+            ("User C", "shared@test.com", "", "", None),
+            ("User D", "shared@test.com", "", "", None),
+        ]
+        user_ids = self.db.add_users_many(rows)
+
+        self.assertEqual(len(user_ids), 4)
+        self.assertEqual([self.db.get_user(uid)['name'] for uid in user_ids],
+                         ["User A", "User B", "User C", "User D"])
+        self.assertEqual(self.db.get_user(user_ids[1])['company_id'], company_id)
+        self.assertEqual(len(self.db.get_all_users()), 5)
+
+    def test_add_users_many_partial_failure_in_bulk(self):
+        """Test that a failing batch inside bulk() leaves none of its users behind"""
+        company_id = self.db.add_company("Test Company")
+
+        with self.db.bulk():
+            with self.assertRaises(sqlite3.IntegrityError):
+                self.db.add_users_many([
+                    ("User A", "", "", "", company_id),
+                    (None, "", "", "", company_id),
+                ])
+
+        self.assertEqual(self.db.get_all_users(), [])
+
     def test_get_user(self):
         """Test retrieving a user"""
         user_id = self.db.add_user("Test User")
@@ -78,6 +188,13 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIsNotNone(user)
         self.assertEqual(user['name'], "Test User")
 
+    def test_get_user_by_name(self):
+        """Test retrieving the first user with an exact name"""
+        first_id = self.db.add_user("Test User")
+        self.db.add_user("Test User")
+        self.assertEqual(self.db.get_user_by_name("Test User")['id'], first_id)
+        self.assertIsNone(self.db.get_user_by_name("Nobody"))
+
     def test_user_with_company(self):
         """Test user with company association"""
         company_id = self.db.add_company("Test Company")
@@ -140,6 +257,24 @@ class TestDatabaseManager(unittest.TestCase):
         company = self.db.get_company(company_id)
         self.assertEqual(company['balance'], 700.0)
 
+    def test_balance_rounded_to_paise(self):
+        """Test that repeated fractional deposits do not accumulate float drift"""
+        user_id = self.db.add_user("Test User")
+        for _ in range(3):
+            self.db.deposit("user", user_id, 0.1)
+
+        self.assertEqual(self.db.get_user(user_id)['balance'], 0.3)
+
+        # A withdrawal of the exact balance must be allowed
+        self.db.withdraw("user", user_id, 0.3)
+        self.assertEqual(self.db.get_user(user_id)['balance'], 0.0)
+
+    def test_amount_below_one_paisa_rejected(self):
+        """Test that amounts rounding to zero paise are rejected"""
+        user_id = self.db.add_user("Test User")
+        with self.assertRaises(ValueError):
+            self.db.deposit("user", user_id, 0.004)
+
     def test_withdraw_insufficient_balance(self):
         """Test withdraw with insufficient balance"""
         company_id = self.db.add_company("Test Company")
@@ -174,28 +309,285 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(self.db.get_company(company_id)['balance'], 1000.0)
         self.assertEqual(self.db.get_user(user_id)['balance'], 0.0)
 
-    # Pagination Tests
-    def test_get_transactions_paginated(self):
-        """Test paginated transaction retrieval"""
+    # Ledger Tests
+    def test_account_ledger_running_balance(self):
+        """Test ledger order and running balance across mixed date formats"""
         company_id = self.db.add_company("Test Company")
         user_id = self.db.add_user("Test User")
-        self.db.update_company_balance(company_id, 10000.0)
 
-        # Add multiple transactions
-        for i in range(25):
+        # Inserted out of date order; one date is stored as YYYY-MM-DD
+        self.db.add_transaction("15-02-2024", 30.0, "company", company_id, "user", user_id, "Second")
+        self.db.add_transaction("2024-01-10", 100.0, "user", user_id, "company", company_id, "First")
+        self.db.add_transaction("01-03-2024", 20.5, "company", company_id, "user", user_id, "Third")
+
+        ledger = self.db.get_account_ledger("company", company_id)
+
+        # Newest first
+        self.assertEqual([e['description'] for e in ledger], ["Third", "Second", "First"])
+        self.assertEqual([e['type'] for e in ledger], ["Debit", "Debit", "Credit"])
+        self.assertEqual([e['running_balance'] for e in ledger], [49.5, 70.0, 100.0])
+        self.assertEqual(ledger[0]['other_party'], "Test User")
+
+    def test_account_ledger_cash_entries(self):
+        """Test deposits and withdrawals appear as cash entries"""
+        user_id = self.db.add_user("Test User")
+        self.db.deposit("user", user_id, 200.0)
+        self.db.withdraw("user", user_id, 50.0)
+
+        ledger = self.db.get_account_ledger("user", user_id)
+
+        self.assertEqual([e['other_party'] for e in ledger], ["Cash Withdrawal", "Cash Deposit"])
+        self.assertEqual(ledger[0]['running_balance'], 150.0)
+
+    # Cache Tests
+    def test_get_all_cache_invalidation(self):
+        """Test cached list results are refreshed after writes"""
+        company_id = self.db.add_company("Cached Company")
+        first = self.db.get_all_companies()
+        second = self.db.get_all_companies()
+        self.assertIsNot(first, second)
+
+        # Callers get copies, so mutating one result cannot corrupt the cache
+        first[0]['name'] = "Mutated"
+        self.assertEqual(self.db.get_all_companies()[0]['name'], "Cached Company")
+
+        self.db.update_company_balance(company_id, 50.0)
+        self.assertEqual(self.db.get_all_companies()[0]['balance'], 50.0)
+
+        # Transaction rows embed entity names, so a rename must show up
+        user_id = self.db.add_user("Cached User")
+        self.db.add_transaction("01-01-2024", 10.0, "company", company_id, "user", user_id)
+        self.assertEqual(self.db.get_all_transactions()[0]['to_name'], "Cached User")
+        self.db.update_user(user_id, name="Renamed User")
+        self.assertEqual(self.db.get_all_transactions()[0]['to_name'], "Renamed User")
+
+    def test_get_all_cache_sees_other_connections(self):
+        """Test writes committed by another connection invalidate the cache"""
+        self.open_file_db()
+        self.assertEqual(self.db.get_all_users(), [])
+        with DatabaseManager(self.db_path) as other:
+            other.add_user("Other User")
+        self.assertEqual(len(self.db.get_all_users()), 1)
+
+    def test_get_all_cache_after_rollback(self):
+        """Test rows written and then rolled back do not linger in the cache"""
+        self.connection.execute("INSERT INTO companies (name) VALUES ('Rolled Back')")
+        self.assertEqual(len(self.db.get_all_companies()), 1)
+
+        self.connection.rollback()
+        self.assertEqual(self.db.get_all_companies(), [])
+
+    def test_get_all_cache_sees_shared_connection_writes(self):
+        """Test writes by another manager on the same connection invalidate the cache"""
+        self.assertEqual(self.db.get_all_companies(), [])
+        other = DatabaseManager(conn=self.connection)
+        other.add_company("Shared Company")
+        self.assertEqual(len(self.db.get_all_companies()), 1)
+
+        # Writes that bypass execute_update are seen too
+        self.connection.execute("UPDATE companies SET balance = 5.0")
+        self.assertEqual(self.db.get_all_companies()[0]['balance'], 5.0)
+
+    def test_context_manager_closes_connection(self):
+        """Test that leaving a with-block closes the manager's connection"""
+        with DatabaseManager(self.db_path) as db:
+            db.add_company("Scoped Company")
+        self.assertIsNone(db.connection)
+
+    def test_close_survives_failed_optimize(self):
+        """Test that close() still closes the connection if PRAGMA optimize fails"""
+        self.open_file_db()
+        real_connection = self.db.connection
+        connection = self.db.connection = mock.Mock()
+        connection.execute.side_effect = sqlite3.OperationalError("database is locked")
+
+        self.db.close()
+        real_connection.close()
+
+        connection.close.assert_called_once_with()
+        self.assertIsNone(self.db.connection)
+
+    # Bulk Tests
+    def test_bulk_commits_once(self):
+        """Test that writes inside bulk() are committed together"""
+        with self.db.bulk():
+            company_id = self.db.add_company("Bulk Company")
+            user_id = self.db.add_user("Bulk User")
             self.db.add_transaction(
-                f"0{(i % 28) + 1}-01-2024", 10.0,
+                "01-01-2024", 100.0,
                 "company", company_id,
                 "user", user_id
             )
+            self.assertTrue(self.db.connection.in_transaction)
+
+        self.assertFalse(self.db.connection.in_transaction)
+        self.assertEqual(self.db.get_company(company_id)['balance'], -100.0)
+        self.assertEqual(self.db.get_user(user_id)['balance'], 100.0)
+
+    def test_bulk_rolls_back_on_error(self):
+        """Test that an error inside bulk() discards the whole block"""
+        with self.assertRaises(ValueError):
+            with self.db.bulk():
+                self.db.add_company("Bulk Company")
+                self.db.add_transaction(
+                    "01-01-2024", -1.0,
+                    "company", 1,
+                    "user", 1
+                )
+
+        self.assertEqual(self.db.get_all_companies(), [])
+
+    def test_bulk_undoes_failed_operation(self):
+        """Test that a caught failure inside bulk() leaves no half-applied write"""
+        company_id = self.db.add_company("Test Company")
+        user_id = self.db.add_user("Test User")
+
+        with self.db.bulk():
+            self.db.add_transaction(
+                "01-01-2024", 100.0,
+                "company", company_id,
+                "user", user_id
+            )
+            with mock.patch.object(self.db, 'update_user_balance',
+                                   side_effect=sqlite3.OperationalError("disk I/O error")):
+                with self.assertRaises(Exception):
+                    self.db.add_transaction(
+                        "02-01-2024", 50.0,
+                        "company", company_id,
+                        "user", user_id
+                    )
+
+        self.assertEqual(self.db.get_transaction_count(), 1)
+        self.assertEqual(self.db.get_company(company_id)['balance'], -100.0)
+        self.assertEqual(self.db.get_user(user_id)['balance'], 100.0)
+
+    def test_bulk_refuses_open_transaction(self):
+        """Test that bulk() does not commit a caller's pending writes"""
+        self.db.execute_update(
+            "INSERT INTO companies (name) VALUES (?)", ("Pending Company",), auto_commit=False
+        )
+        with self.assertRaises(RuntimeError):
+            with self.db.bulk():
+                pass
+
+        self.db.connection.rollback()
+        self.assertIsNone(self.db.get_company_by_name("Pending Company"))
+
+    def test_add_transactions_many(self):
+        """Test batch insert of transactions with aggregated balance updates"""
+        company_id = self.db.add_company("Test Company")
+        user_id = self.db.add_user("Test User")
+
+        rows = [
+            ("01-01-2024", 100.0, "company", company_id, "user", user_id, "Salary", ""),
+            ("02-01-2024", 40.0, "user", user_id, "company", company_id, "Refund", ""),
+            ("03-01-2024", 10.0, "company", company_id, "user", user_id, "Bonus", ""),
+        ]
+        self.assertEqual(self.db.add_transactions_many(rows), 3)
+
+        self.assertEqual(len(self.db.get_all_transactions()), 3)
+        self.assertEqual(self.db.get_company(company_id)['balance'], -70.0)
+        self.assertEqual(self.db.get_user(user_id)['balance'], 70.0)
+
+        # Rows may come from a generator; all of them land in one batch
+        added = self.db.add_transactions_many(
+            (f"{day:02d}-02-2024", 10.0, "company", company_id, "user", user_id, "", "")
+            for day in range(1, 26)
+        )
+        self.assertEqual(added, 25)
+        self.assertEqual(self.db.get_transaction_count(), 28)
+        self.assertEqual(self.db.get_user(user_id)['balance'], 320.0)
+
+    def test_add_transactions_many_invalid_row(self):
+        """Test that one invalid row rejects the whole batch"""
+        company_id = self.db.add_company("Test Company")
+        user_id = self.db.add_user("Test User")
+
+        with self.assertRaises(ValueError):
+            self.db.add_transactions_many([
+                ("01-01-2024", 100.0, "company", company_id, "user", user_id, "", ""),
+                ("02-01-2024", 0, "company", company_id, "user", user_id, "", ""),
+            ])
+
+        self.assertEqual(self.db.get_all_transactions(), [])
+        self.assertEqual(self.db.get_company(company_id)['balance'], 0.0)
+
+    # Pagination Tests
+    def test_get_transactions_paginated(self):
+        """Test paginated transaction retrieval"""
+        company_id = self.db.add_company("Test Company")
+        user_id = self.db.add_user("Test User")
+        self.db.update_company_balance(company_id, 10000.0)
+
+        # Add multiple transactions in one database transaction
+        dates = [f"{(i % 28) + 1:02d}-01-2024" for i in range(25)]
+        self.db.add_transactions_many(
+            (date, 10.0, "company", company_id, "user", user_id, "", "")
+            for date in dates
+        )
+        self.assertEqual(self.db.get_company(company_id)['balance'], 9750.0)
 
         # Test pagination
         transactions, total = self.db.get_transactions_paginated(page=1, per_page=10)
         self.assertEqual(len(transactions), 10)
         self.assertEqual(total, 25)
+        self.assertEqual(transactions[0]['transaction_date'], "25-01-2024")
 
         transactions, total = self.db.get_transactions_paginated(page=3, per_page=10)
         self.assertEqual(len(transactions), 5)
+        self.assertEqual(total, 25)
+        self.assertNotIn('total_count', transactions[0])
+
+        # Past the last page still reports the total
+        transactions, total = self.db.get_transactions_paginated(page=4, per_page=10)
+        self.assertEqual(transactions, [])
+        self.assertEqual(total, 25)
+
+    def test_get_transactions_keyset(self):
+        """Test cursor-based pagination visits every transaction once"""
+        company_id = self.db.add_company("Test Company")
+        user_id = self.db.add_user("Test User")
+        self.db.add_transactions_many(
+            (f"{(i % 5) + 1:02d}-01-2024", 10.0, "company", company_id, "user", user_id, "", "")
+            for i in range(25)
+        )
+
+        pages = []
+        cursor = None
+        while True:
+            transactions, cursor = self.db.get_transactions_keyset(cursor, limit=10)
+            pages.append(transactions)
+            if cursor is None:
+                break
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        ids = [t['id'] for page in pages for t in page]
+        self.assertEqual(sorted(ids), list(range(1, 26)))
+
+        # Same order as offset pagination
+        offset_ids = [t['id'] for t in self.db.get_transactions_paginated(page=1, per_page=25)[0]]
+        self.assertEqual(ids, offset_ids)
+
+    def test_get_transactions_keyset_null_created_date(self):
+        """Test rows without a created_date are not skipped by the cursor"""
+        company_id = self.db.add_company("Test Company")
+        user_id = self.db.add_user("Test User")
+        self.db.add_transactions_many(
+            ("01-01-2024", 10.0, "company", company_id, "user", user_id, "", "")
+            for _ in range(6)
+        )
+        self.connection.execute("UPDATE transactions SET created_date = NULL WHERE id % 2 = 0")
+        self.connection.commit()
+
+        ids = []
+        cursor = None
+        while True:
+            transactions, cursor = self.db.get_transactions_keyset(cursor, limit=2)
+            ids.extend(t['id'] for t in transactions)
+            if cursor is None:
+                break
+
+        self.assertEqual(sorted(ids), list(range(1, 7)))
 
     # Search Tests
     def test_search_transactions(self):
@@ -217,6 +609,32 @@ class TestDatabaseManager(unittest.TestCase):
         results = self.db.search_transactions("Alpha")
         self.assertEqual(len(results), 1)
 
+    def test_search_transactions_index_sync(self):
+        """Test search index follows inserts, updates and deletes"""
+        company_id = self.db.add_company("Alpha Company")
+        user_id = self.db.add_user("Test User")
+
+        trans_id = self.db.add_transaction(
+            "01-01-2024", 100.0,
+            "company", company_id,
+            "user", user_id,
+            "Office rent", "INV-2024-001"
+        )
+
+        self.assertEqual(len(self.db.search_transactions("inv-2024")), 1)
+        self.assertEqual(len(self.db.search_transactions("RENT")), 1)
+        self.assertEqual(len(self.db.search_transactions("nt")), 1)
+
+        self.db.execute_update(
+            "UPDATE transactions SET description = ? WHERE id = ?",
+            ("Electricity bill", trans_id)
+        )
+        self.assertEqual(len(self.db.search_transactions("rent")), 0)
+        self.assertEqual(len(self.db.search_transactions("electric")), 1)
+
+        self.db.delete_transaction(trans_id)
+        self.assertEqual(len(self.db.search_transactions("electric")), 0)
+
     def test_search_companies(self):
         """Test company search"""
         self.db.add_company("Alpha Corp", email="alpha@test.com")
@@ -237,6 +655,22 @@ class TestDatabaseManager(unittest.TestCase):
         results = self.db.search_users("Sales")
         self.assertEqual(len(results), 1)
 
+    def test_search_companies_and_users_index_sync(self):
+        """Test company and user search indexes follow updates and deletes"""
+        company_id = self.db.add_company("Alpha Corp", phone="9876543210")
+        user_id = self.db.add_user("John Smith", email="john@test.com")
+
+        self.assertEqual(len(self.db.search_companies("765")), 1)
+        self.assertEqual(len(self.db.search_companies("ph")), 1)
+        self.assertEqual(len(self.db.search_users("JOHN@")), 1)
+
+        self.db.update_company(company_id, name="Gamma Corp")
+        self.assertEqual(len(self.db.search_companies("alpha")), 0)
+        self.assertEqual(len(self.db.search_companies("gamma")), 1)
+
+        self.db.delete_user(user_id)
+        self.assertEqual(len(self.db.search_users("john")), 0)
+
     # Validation Tests
     def test_invalid_transaction_amount(self):
         """Test that negative amounts are rejected"""
@@ -259,20 +693,24 @@ class TestDatabaseManager(unittest.TestCase):
                 "user", 1
             )
 
+    # Backup Tests
+    def test_get_backups_newest_first(self):
+        """Test that backups are listed newest first and other files are ignored"""
+        names = ['backup_old.db', 'backup_new.db', 'notes.txt']
+        paths = [os.path.join(self.temp_dir, name) for name in names]
+        for mtime, path in enumerate(paths, start=1):
+            with open(path, 'w') as f:
+                f.write('x')
+            os.utime(path, (mtime * 86400, mtime * 86400))
 
-class TestDatabaseBalances(unittest.TestCase):
-    """Test balance calculations"""
+        backups = self.db.get_backup_list(self.temp_dir)
+        self.assertEqual([b['filename'] for b in backups], ['backup_new.db', 'backup_old.db'])
+        self.assertEqual(backups[0]['path'], paths[1])
+        self.assertEqual(backups[0]['size'], 1)
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, 'test.db')
-        self.db = DatabaseManager(self.db_path)
 
-    def tearDown(self):
-        self.db.close()
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+class TestDatabaseBalances(DatabaseTestCase):
+    """Test balance calculations"""
 
     def test_total_balances(self):
         """Test total balance calculations"""
@@ -294,6 +732,73 @@ class TestDatabaseBalances(unittest.TestCase):
         self.assertEqual(balances['user_total'], 800.0)
         self.assertEqual(balances['grand_total'], 3800.0)
 
+    def test_total_balances_empty(self):
+        """Test totals are zero when there are no accounts"""
+        balances = self.db.get_total_balances()
+
+        self.assertEqual(balances, {'company_total': 0.0, 'user_total': 0.0, 'grand_total': 0.0})
+
+    def test_transaction_summary(self):
+        """Test transaction count, total and average"""
+        self.assertEqual(self.db.get_transaction_summary()['total_count'], 0)
+
+        user_id = self.db.add_user("Test User")
+        self.db.deposit("user", user_id, 100.0)
+        self.db.deposit("user", user_id, 50.0)
+
+        summary = self.db.get_transaction_summary()
+        self.assertEqual(summary['total_count'], 2)
+        self.assertEqual(summary['total_amount'], 150.0)
+        self.assertEqual(summary['average_amount'], 75.0)
+
+
+class TestSQLitePool(unittest.TestCase):
+    """Test pooled connections shared with DatabaseManager"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, 'test.db')
+        self.pool = SQLitePool(self.db_path, size=2)
+
+    def tearDown(self):
+        self.pool.close()
+        self._tmp.cleanup()
+
+    def test_manager_with_pooled_connection(self):
+        """Test that data written through one pooled manager is visible to the next"""
+        with self.pool.acquire() as conn:
+            with DatabaseManager(conn=conn) as db:
+                db.add_company("Pooled Company")
+
+            # close() must leave the pooled connection usable
+            conn.execute("SELECT 1")
+
+        with self.pool.acquire() as conn:
+            with DatabaseManager(conn=conn) as db:
+                self.assertEqual(db.db_path, os.path.realpath(self.db_path))
+                self.assertEqual(len(db.get_all_companies()), 1)
+
+    def test_get_pool_is_shared(self):
+        """Test that get_pool returns one pool per database path"""
+        pool = get_pool(self.db_path, size=1)
+        try:
+            self.assertIs(pool, get_pool(self.db_path))
+        finally:
+            pool.close()
+
+    def test_get_pool_after_close(self):
+        """Test that a closed pool is replaced rather than handed out again"""
+        pool = get_pool(self.db_path, size=1)
+        pool.close()
+
+        new_pool = get_pool(self.db_path, size=1)
+        try:
+            self.assertIsNot(new_pool, pool)
+            with new_pool.acquire() as conn:
+                conn.execute("SELECT 1")
+        finally:
+            new_pool.close()
+
 
 if __name__ == '__main__':
     unittest.main()
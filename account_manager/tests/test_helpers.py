@@ -5,22 +5,41 @@ Helper Functions Tests
 import unittest
 import sys
 import os
+import tempfile
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path (once - a test runner may already have it)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
 
 from utils.helpers import (
     format_currency,
+    format_indian,
+    clean_amount_text,
     format_date,
+    get_current_date,
     validate_email,
     validate_phone,
     validate_amount,
+    validate_amounts,
+    validate_emails,
     sanitize_string,
     validate_name,
     validate_description,
     validate_date_input,
     normalize_date_for_sort,
-    truncate_string
+    truncate_string,
+    confirm_action,
+    handle_error,
+    confirm_bulk_action,
+    get_balance_color,
+    export_to_csv,
+    import_from_csv,
+    import_from_csv_iter,
+    iter_csv_chunks
 )
 
 
@@ -49,6 +68,117 @@ class TestFormatCurrency(unittest.TestCase):
     def test_zero_amount(self):
         """Test zero amount"""
         self.assertEqual(format_currency(0), "₹0.00")
+        self.assertEqual(format_currency(-0.0), "₹0.00")
+
+    def test_decimal_amount(self):
+        """Test Decimal amounts are formatted like floats"""
+        self.assertEqual(format_currency(Decimal("1234567.5")), "₹12,34,567.50")
+        self.assertEqual(format_currency(Decimal("-10")), "₹-10.00")
+
+    def test_non_finite_amount(self):
+        """Test nan and inf are shown without a dangling decimal point"""
+        self.assertEqual(format_currency(float('nan')), "₹nan")
+        self.assertEqual(format_currency(float('inf')), "₹inf")
+        self.assertEqual(format_currency(float('-inf')), "₹-inf")
+
+    def test_lakh_boundary(self):
+        """Test amounts either side of one lakh, including rounding up into it"""
+        self.assertEqual(format_currency(99999.99), "₹99,999.99")
+        self.assertEqual(format_currency(99999.996), "₹1,00,000.00")
+        self.assertEqual(format_currency(-99999.99), "₹-99,999.99")
+        self.assertEqual(format_currency(-100000), "₹-1,00,000.00")
+
+
+class TestFormatIndian(unittest.TestCase):
+    """Test Indian digit grouping"""
+
+    def test_short_numbers(self):
+        """Test numbers of 3 digits or fewer are unchanged"""
+        self.assertEqual(format_indian("0"), "0")
+        self.assertEqual(format_indian("999"), "999")
+
+    def test_grouping(self):
+        """Test groups of 3 then 2"""
+        self.assertEqual(format_indian("1000"), "1,000")
+        self.assertEqual(format_indian("150000"), "1,50,000")
+        self.assertEqual(format_indian("1234567"), "12,34,567")
+        self.assertEqual(format_indian("123456789012345678"), "1,23,45,67,89,01,23,45,678")
+
+
+class TestHandleError(unittest.TestCase):
+    """Test user-friendly error messages"""
+
+    def test_known_and_unknown_errors(self):
+        """Test errors map to friendly messages, case-insensitively"""
+        with self.assertLogs('AccountManager', level='ERROR'):
+            self.assertEqual(
+                handle_error(Exception("unique CONSTRAINT failed: companies.name"), show_dialog=False),
+                "This item already exists. Please use a different name."
+            )
+            self.assertEqual(
+                handle_error(ValueError("boom"), show_dialog=False),
+                "An unexpected error occurred. Please try again."
+            )
+            self.assertEqual(handle_error(ValueError("boom"), "Custom", show_dialog=False), "Custom")
+
+
+class TestConfirmAction(unittest.TestCase):
+    """Test confirmation dialog helper"""
+
+    def test_uses_dialog_with_message_first(self):
+        """Test confirm_action(message, title) asks through a yes/no dialog"""
+        with mock.patch('tkinter.messagebox.askyesno', return_value=True) as ask:
+            self.assertTrue(confirm_action("Delete it?", "Confirm Deletion"))
+        ask.assert_called_once_with("Confirm Deletion", "Delete it?")
+
+    def test_remember_key_asks_once(self):
+        """Test a remembered answer is reused for the same key"""
+        with mock.patch('tkinter.messagebox.askyesno', return_value=True) as ask:
+            with mock.patch.dict('utils.helpers._CONFIRM_CACHE', clear=True):
+                self.assertTrue(confirm_action("Delete?", remember_key="delete_backup"))
+                self.assertTrue(confirm_action("Delete?", remember_key="delete_backup"))
+                self.assertTrue(confirm_action("Restore?", remember_key="restore"))
+        self.assertEqual(ask.call_count, 2)
+
+    def test_bulk_action_asks_once(self):
+        """Test a batch is confirmed with a single dialog"""
+        with mock.patch('tkinter.messagebox.askyesno', return_value=True) as ask:
+            self.assertEqual(confirm_bulk_action(iter([1, 2, 3]), "Delete {count} items?"), [1, 2, 3])
+            self.assertEqual(confirm_bulk_action([], "Delete {count} items?"), [])
+        ask.assert_called_once_with("Confirm", "Delete 3 items?")
+
+        with mock.patch('tkinter.messagebox.askyesno', return_value=False):
+            self.assertEqual(confirm_bulk_action([1], "Delete {count} items?"), [])
+
+
+class TestCleanAmountText(unittest.TestCase):
+    """Test amount input filtering"""
+
+    def test_plain_digits(self):
+        """Test digit-only input is returned unchanged"""
+        self.assertEqual(clean_amount_text("150000"), "150000")
+
+    def test_strips_separators(self):
+        """Test commas, spaces and letters are removed"""
+        self.assertEqual(clean_amount_text("1,50,000.50"), "150000.50")
+        self.assertEqual(clean_amount_text("Rs 1 000"), "1000")
+
+    def test_strips_non_ascii(self):
+        """Test currency symbols outside ASCII are removed"""
+        self.assertEqual(clean_amount_text("₹1,234.5"), "1234.5")
+        self.assertEqual(clean_amount_text(""), "")
+
+
+class TestGetCurrentDate(unittest.TestCase):
+    """Test current date formatting"""
+
+    def test_default_format(self):
+        """Test default DD-MM-YYYY format matches today"""
+        self.assertEqual(get_current_date(), datetime.now().strftime("%d-%m-%Y"))
+
+    def test_custom_format(self):
+        """Test a custom format is honoured"""
+        self.assertEqual(get_current_date("%Y-%m-%d"), datetime.now().strftime("%Y-%m-%d"))
 
 
 class TestFormatDate(unittest.TestCase):
@@ -74,6 +204,13 @@ class TestFormatDate(unittest.TestCase):
         result = format_date("invalid")
         self.assertEqual(result, "invalid")
 
+    def test_output_format_per_call(self):
+        """Test the same date formats differently per output format"""
+        self.assertEqual(format_date("15-01-2024"), "15 January, 2024")
+        self.assertEqual(format_date("2024-03-05"), "05 March, 2024")
+        self.assertEqual(format_date("15-01-2024", output_format="%Y/%m/%d"), "2024/01/15")
+        self.assertEqual(format_date(datetime(2024, 1, 15), output_format="%d-%m"), "15-01")
+
 
 class TestValidateEmail(unittest.TestCase):
     """Test email validation"""
@@ -124,6 +261,9 @@ class TestValidateAmount(unittest.TestCase):
         self.assertTrue(is_valid)
         self.assertEqual(amount, 1000.0)
 
+        for text in ("Rs. 2,500.50", "Rs2500.50", "INR 2500.50 ", "$2,500.50"):
+            self.assertEqual(validate_amount(text), (True, 2500.5))
+
     def test_negative_amount(self):
         """Test negative amount is invalid"""
         is_valid, _ = validate_amount("-100")
@@ -140,6 +280,23 @@ class TestValidateAmount(unittest.TestCase):
         self.assertFalse(is_valid)
 
 
+class TestValidateColumns(unittest.TestCase):
+    """Test whole-column validation used for imports"""
+
+    def test_amounts_match_scalar_validation(self):
+        """Test each entry gets the same result as validate_amount"""
+        values = ["₹1,000", "Rs. 25.50", "INR 3", "-5", "0", "abc", None, "1\n2", "$7"]
+        expected = [amount if valid else None
+                    for valid, amount in map(validate_amount, values)]
+        self.assertEqual(validate_amounts(values), expected)
+        self.assertEqual(validate_amounts(values[:3]), [1000.0, 25.5, 3.0])
+        self.assertEqual(validate_amounts([]), [])
+
+    def test_emails(self):
+        """Test empty entries are allowed and malformed ones rejected"""
+        self.assertEqual(validate_emails(["", "a@b.co", "bad"]), [True, True, False])
+
+
 class TestSanitizeString(unittest.TestCase):
     """Test string sanitization"""
 
@@ -230,6 +387,15 @@ class TestNormalizeDateForSort(unittest.TestCase):
         """Test empty date"""
         self.assertEqual(normalize_date_for_sort(""), "")
 
+    def test_single_digit_day_and_month(self):
+        """Test unpadded DD-MM-YYYY still normalizes"""
+        self.assertEqual(normalize_date_for_sort("5-1-2024"), "2024-01-05")
+
+    def test_unparseable_date(self):
+        """Test unrecognised strings are returned unchanged"""
+        self.assertEqual(normalize_date_for_sort("2024-99-99"), "2024-99-99")
+        self.assertEqual(normalize_date_for_sort("someday"), "someday")
+
 
 class TestTruncateString(unittest.TestCase):
     """Test string truncation"""
@@ -244,6 +410,67 @@ class TestTruncateString(unittest.TestCase):
         result = truncate_string("Hello", 10)
         self.assertEqual(result, "Hello")
 
+    def test_max_length_shorter_than_suffix(self):
+        """Test the result never exceeds max_length"""
+        self.assertEqual(truncate_string("Hello World", 2), "..")
+        self.assertEqual(truncate_string("Hello World", 0), "")
+        self.assertEqual(truncate_string("Hello World", 6, suffix="~"), "Hello~")
+
+
+class TestGetBalanceColor(unittest.TestCase):
+    """Test balance color lookup"""
+
+    def test_sign_colors(self):
+        """Test positive, negative and zero balances"""
+        self.assertEqual(get_balance_color(150.5), "green")
+        self.assertEqual(get_balance_color(-0.01), "red")
+        self.assertEqual(get_balance_color(0), "gray")
+        self.assertEqual(get_balance_color(0.0), "gray")
+
+
+class TestCsvRoundTrip(unittest.TestCase):
+    """Test CSV export and import"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self._tmp.name, 'rows.csv')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_export_generator_and_read_chunks(self):
+        """Test rows streamed from a generator come back in chunks"""
+        export_to_csv(({'id': str(i), 'name': f"Row {i}"} for i in range(5)), self.filename)
+
+        chunks = list(iter_csv_chunks(self.filename, chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks[2][0], {'id': '4', 'name': "Row 4"})
+        self.assertEqual(len(import_from_csv(self.filename)), 5)
+
+        rows = import_from_csv_iter(self.filename)
+        self.assertEqual(next(rows), {'id': '0', 'name': "Row 0"})
+        self.assertEqual(sum(1 for _ in rows), 4)
+
+    def test_export_selected_and_missing_fields(self):
+        """Test fieldnames pick columns and missing values are written empty"""
+        export_to_csv([{'a': 1, 'b': 2, 'c': 3}, {'a': 4}], self.filename, fieldnames=['a', 'b'])
+        self.assertEqual(import_from_csv(self.filename),
+                         [{'a': '1', 'b': '2'}, {'a': '4', 'b': ''}])
+
+        export_to_csv([{'a': 1, 'b': 2}], self.filename, fieldnames=['b'])
+        self.assertEqual(import_from_csv(self.filename), [{'b': '2'}])
+
+    def test_export_no_fields(self):
+        """Test an empty field list writes an empty header instead of failing"""
+        export_to_csv([{'a': 1}], self.filename, fieldnames=[])
+        with open(self.filename, newline='', encoding='utf-8') as csvfile:
+            self.assertEqual(csvfile.read(), "\r\n\r\n")
+
+    def test_export_empty(self):
+        """Test exporting nothing is rejected"""
+        with self.assertRaises(ValueError):
+            export_to_csv(iter([]), self.filename)
+
 
 if __name__ == '__main__':
     unittest.main()
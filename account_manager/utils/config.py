@@ -2,11 +2,14 @@
 Application Configuration - Centralized settings for colors, fonts, and sizes
 """
 
+from types import MappingProxyType
+
 # =============================================================================
 # COLOR SCHEME
 # =============================================================================
+# All settings tables are read-only views - change values here, not at runtime
 
-COLORS = {
+COLORS = MappingProxyType({
     # Primary colors
     'primary': '#1f538d',
     'primary_hover': '#14375e',
@@ -40,13 +43,13 @@ COLORS = {
     'btn_success': '#28a745',
     'btn_danger': '#dc3545',
     'btn_secondary': '#6c757d',
-}
+})
 
 # =============================================================================
 # TYPOGRAPHY
 # =============================================================================
 
-FONTS = {
+FONTS = MappingProxyType({
     # Font family
     'family': 'Roboto',
 
@@ -72,13 +75,18 @@ FONTS = {
     'amount_large': ('Roboto', 28, 'bold'),
     'amount_medium': ('Roboto', 18, 'bold'),
     'amount_small': ('Roboto', 16, 'bold'),
-}
+})
+
+# Fonts read for every card that is drawn, as plain module constants
+CARD_TITLE_FONT = FONTS['card_title']
+CARD_SUBTITLE_FONT = FONTS['card_subtitle']
+CARD_DETAIL_FONT = FONTS['card_detail']
 
 # =============================================================================
 # SIZES AND DIMENSIONS
 # =============================================================================
 
-SIZES = {
+SIZES = MappingProxyType({
     # Window dimensions
     'window_width': 1200,
     'window_height': 700,
@@ -115,13 +123,13 @@ SIZES = {
 
     # List items
     'list_item_height': 40,
-}
+})
 
 # =============================================================================
 # APPLICATION SETTINGS
 # =============================================================================
 
-APP_SETTINGS = {
+APP_SETTINGS = MappingProxyType({
     'app_name': 'Account Manager',
     'version': '1.2.0',
 
@@ -143,28 +151,28 @@ APP_SETTINGS = {
     # Currency
     'currency_symbol': '₹',
     'decimal_places': 2,
-}
+})
 
 # =============================================================================
 # THEME CONFIGURATION
 # =============================================================================
 
-THEME = {
+THEME = MappingProxyType({
     'mode': 'dark',  # 'dark' or 'light'
     'color_theme': 'blue',  # customtkinter theme
-}
+})
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Indexed by sign(balance) + 1: negative, zero, positive
+_BALANCE_COLORS = (COLORS['negative_balance'], COLORS['neutral'], COLORS['positive_balance'])
+
+
 def get_balance_color(balance: float) -> str:
     """Get color based on balance value"""
-    if balance > 0:
-        return COLORS['positive_balance']
-    elif balance < 0:
-        return COLORS['negative_balance']
-    return COLORS['neutral']
+    return _BALANCE_COLORS[(balance > 0) - (balance < 0) + 1]
 
 
 def get_font(font_key: str) -> tuple:
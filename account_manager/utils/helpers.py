@@ -2,11 +2,21 @@
 Helper Functions - Utility functions for the application
 """
 
-from datetime import datetime
-from typing import Union, Callable, Optional, List
-import customtkinter as ctk
-from tkinter import messagebox
+import csv
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+import re
+from typing import Union, Callable, Optional, List, Dict, Iterable, Iterator
 import logging
+from types import MappingProxyType
+
+# tkinter/customtkinter are imported inside the dialog helpers and DropdownButton,
+# so the database layer (which imports this module) never loads Tk
+
+# Shared with the card widgets; kept importable from here for existing callers
+from utils.config import get_balance_color
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +25,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger('AccountManager')
 
+# Validation patterns, compiled once at import
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+_DATE_INPUT_RE = re.compile(r'^\d{2}-\d{2}-\d{4}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)\.]')
+_PHONE_RE = re.compile(r'^\d{10,15}$')
+
+
+# Common errors mapped to user-friendly messages (keys lowercased, checked in order)
+_ERROR_MESSAGES = tuple((key.lower(), message) for key, message in (
+    ('UNIQUE constraint failed', "This item already exists. Please use a different name."),
+    ('FOREIGN KEY constraint failed', "Cannot delete this item because it is referenced by other records."),
+    ('NOT NULL constraint failed', "Please fill in all required fields."),
+    ('CHECK constraint failed', "Invalid value provided. Please check your input."),
+    ('no such table', "Database error. Please restart the application."),
+    ('database is locked', "Database is busy. Please try again in a moment."),
+    ('Insufficient balance', "Insufficient balance for this operation."),
+    ('not found', "The requested item was not found."),
+))
+
 
 def handle_error(error: Exception, user_message: str = None, show_dialog: bool = True) -> str:
     """
@@ -28,30 +58,16 @@ def handle_error(error: Exception, user_message: str = None, show_dialog: bool =
     Returns:
         User-friendly error message
     """
-    # Log the technical error
-    logger.error(f"Error: {error}", exc_info=True)
-
-    # Map common errors to user-friendly messages
-    error_messages = {
-        'UNIQUE constraint failed': "This item already exists. Please use a different name.",
-        'FOREIGN KEY constraint failed': "Cannot delete this item because it is referenced by other records.",
-        'NOT NULL constraint failed': "Please fill in all required fields.",
-        'CHECK constraint failed': "Invalid value provided. Please check your input.",
-        'no such table': "Database error. Please restart the application.",
-        'database is locked': "Database is busy. Please try again in a moment.",
-        'Insufficient balance': "Insufficient balance for this operation.",
-        'not found': "The requested item was not found.",
-    }
-
-    error_str = str(error)
+    # Log the technical error (message and traceback are only built if logged)
+    logger.error("Error: %s", error, exc_info=True)
 
     # Find matching error message
     friendly_message = user_message
     if not friendly_message:
-        for key, message in error_messages.items():
-            if key.lower() in error_str.lower():
-                friendly_message = message
-                break
+        error_str = str(error).lower()
+        friendly_message = next(
+            (message for key, message in _ERROR_MESSAGES if key in error_str), None
+        )
 
     # Default message if no match
     if not friendly_message:
@@ -59,6 +75,7 @@ def handle_error(error: Exception, user_message: str = None, show_dialog: bool =
 
     # Show dialog if requested
     if show_dialog:
+        from tkinter import messagebox
         messagebox.showerror("Error", friendly_message)
 
     return friendly_message
@@ -66,22 +83,122 @@ def handle_error(error: Exception, user_message: str = None, show_dialog: bool =
 
 def show_success(message: str, title: str = "Success"):
     """Show success message dialog"""
+    from tkinter import messagebox
     messagebox.showinfo(title, message)
 
 
 def show_warning(message: str, title: str = "Warning"):
     """Show warning message dialog"""
+    from tkinter import messagebox
     messagebox.showwarning(title, message)
 
 
-def confirm_action(message: str, title: str = "Confirm") -> bool:
+# Answers given to confirm_action(remember_key=...) for the rest of the session
+_CONFIRM_CACHE: Dict[str, bool] = {}
+
+
+def confirm_action(message: str, title: str = "Confirm", *, remember_key: str = None) -> bool:
     """
     Show confirmation dialog
 
+    Args:
+        message: Question to ask
+        title: Dialog title
+        remember_key: If given, the answer is remembered and later calls with
+                      the same key return it without asking again
+
     Returns:
         True if user confirms, False otherwise
     """
-    return messagebox.askyesno(title, message)
+    if remember_key is not None and remember_key in _CONFIRM_CACHE:
+        return _CONFIRM_CACHE[remember_key]
+
+    from tkinter import messagebox
+    answer = messagebox.askyesno(title, message)
+    if remember_key is not None:
+        _CONFIRM_CACHE[remember_key] = answer
+    return answer
+
+
+def confirm_bulk_action(items: Iterable, message: str, title: str = "Confirm") -> list:
+    """
+    Ask once for a whole batch instead of once per item
+
+    Args:
+        items: Items the action applies to
+        message: Question to ask; "{count}" is replaced by the number of items
+        title: Dialog title
+
+    Returns:
+        All items if the user confirms, otherwise an empty list
+    """
+    items = list(items)
+    if not items:
+        return []
+    from tkinter import messagebox
+    if messagebox.askyesno(title, message.replace("{count}", str(len(items)))):
+        return items
+    return []
+
+
+# Deletes every ASCII character that cannot appear in an amount
+_AMOUNT_DELETE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isdigit() or chr(c) == '.')
+))
+
+
+def clean_amount_text(text: str) -> str:
+    """
+    Strip everything except digits and the decimal point from amount input
+
+    Args:
+        text: Raw text from an amount entry (may contain commas, ₹, etc.)
+
+    Returns:
+        Only the digits and '.' characters of text
+    """
+    if text.isascii() and text.isdigit():
+        return text
+
+    cleaned = text.translate(_AMOUNT_DELETE)
+    if not cleaned.isascii():
+        # Rare: pasted symbols such as ₹ are outside the ASCII table
+        cleaned = ''.join(c for c in cleaned if c.isdigit() or c == '.')
+    return cleaned
+
+
+def _indian_group_slices(n: int) -> tuple:
+    """Slices that split an n-digit string into Indian groups (1-2 digit head, pairs, last 3)"""
+    head_len = (n - 3) % 2
+    slices = [slice(0, head_len)] if head_len else []
+    slices += [slice(i, i + 2) for i in range(head_len, n - 3, 2)]
+    slices.append(slice(n - 3, n))
+    return tuple(slices)
+
+
+# Per digit count, one itemgetter that cuts out every group in a single C call
+# (covers amounts below 10^20; longer ones build their slices on the fly)
+_INDIAN_GROUPERS = {n: itemgetter(*_indian_group_slices(n)) for n in range(4, 21)}
+
+
+def format_indian(int_str: str) -> str:
+    """
+    Group a string of digits in the Indian number system (e.g. "150000" -> "1,50,000")
+
+    Args:
+        int_str: Digits of the integer part (no sign, no separators)
+
+    Returns:
+        Digits grouped as the last 3, then groups of 2
+    """
+    n = len(int_str)
+    if n <= 3:
+        return int_str
+
+    grouper = _INDIAN_GROUPERS.get(n)
+    if grouper is None:
+        grouper = itemgetter(*_indian_group_slices(n))
+    return ','.join(grouper(int_str))
 
 
 def format_currency(amount: float) -> str:
@@ -94,44 +211,29 @@ def format_currency(amount: float) -> str:
     Returns:
         Formatted currency string in Indian style (e.g., "₹1,50,000.00")
     """
-    # Split into integer and decimal parts
-    amount_str = f"{amount:.2f}"
-    parts = amount_str.split('.')
-    integer_part = parts[0]
-    decimal_part = parts[1] if len(parts) > 1 else "00"
-
-    # Handle negative numbers
-    is_negative = False
-    if integer_part.startswith('-'):
-        is_negative = True
-        integer_part = integer_part[1:]
-
-    # Format in Indian style (groups of 3, then 2)
-    if len(integer_part) <= 3:
-        formatted = integer_part
-    else:
-        # Reverse the string for easier grouping
-        reversed_num = integer_part[::-1]
-
-        # First group of 3 digits
-        groups = [reversed_num[:3]]
-        remaining = reversed_num[3:]
+    # float() accepts Decimal and int; + 0.0 turns -0.0 into 0.0 (the two hash
+    # alike, so they must format alike)
+    return _format_currency(float(amount) + 0.0)
 
-        # Then groups of 2
-        while remaining:
-            groups.append(remaining[:2])
-            remaining = remaining[2:]
 
-        # Join groups with comma and reverse back
-        formatted = ','.join(groups)
-        formatted = formatted[::-1]
+@lru_cache(maxsize=2048)
+def _format_currency(amount: float) -> str:
+    """Cached body of format_currency - ledgers repeat the same amounts and balances"""
+    # Below one lakh Indian and Western grouping agree, so the C-level
+    # ',' format spec does all the work in one call
+    if -99999.99 <= amount <= 99999.99:
+        return f"₹{amount:,.2f}"
 
-    # Add negative sign if needed
-    if is_negative:
-        formatted = '-' + formatted
+    # Split the unsigned value into integer and decimal parts
+    sign = '-' if amount < 0 else ''
+    unsigned = f"{abs(amount):.2f}"
+    if '.' not in unsigned:
+        # nan / inf have no digits to group
+        return f"₹{sign}{unsigned}"
+    integer_part, _, decimal_part = unsigned.partition('.')
 
-    # Return with rupee symbol
-    return f"₹{formatted}.{decimal_part}"
+    # Format in Indian style (groups of 3, then 2) and add the rupee symbol
+    return f"₹{sign}{format_indian(integer_part)}.{decimal_part}"
 
 
 def format_date(date_str: Union[str, datetime], input_format: str = "%d-%m-%Y",
@@ -153,29 +255,52 @@ def format_date(date_str: Union[str, datetime], input_format: str = "%d-%m-%Y",
     if not date_str:
         return date_str
 
-    # Try the specified input format first
-    try:
-        date_obj = datetime.strptime(date_str, input_format)
-        return date_obj.strftime(output_format)
-    except ValueError:
-        pass
+    return _format_date_str(date_str, input_format, output_format)
 
-    # Auto-detect format: try DD-MM-YYYY
-    try:
-        date_obj = datetime.strptime(date_str, "%d-%m-%Y")
-        return date_obj.strftime(output_format)
-    except ValueError:
-        pass
 
-    # Try YYYY-MM-DD
-    try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        return date_obj.strftime(output_format)
-    except ValueError:
-        pass
+_DISPLAY_DATE_FORMAT = "%d %B, %Y"
+_MONTH_NAMES = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
 
-    # Return original if nothing works
-    return date_str
+
+@lru_cache(maxsize=4096)
+def _format_date_str(date_str: str, input_format: str, output_format: str) -> str:
+    """Parse and reformat a date string (cached - tables redraw the same dates)"""
+    date_obj = _parse_dd_mm_yyyy(date_str) if input_format == "%d-%m-%Y" else None
+
+    if date_obj is None:
+        # Try the specified input format first, then auto-detect DD-MM-YYYY / YYYY-MM-DD
+        for fmt in (input_format, "%d-%m-%Y", "%Y-%m-%d"):
+            try:
+                date_obj = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                pass
+        else:
+            # Return original if nothing works
+            return date_str
+
+    if output_format == _DISPLAY_DATE_FORMAT:
+        # Default display format without strftime's locale lookup
+        return f"{date_obj.day:02d} {_MONTH_NAMES[date_obj.month]}, {date_obj.year}"
+    return date_obj.strftime(output_format)
+
+
+def _parse_dd_mm_yyyy(date_str: str) -> Optional[datetime]:
+    """
+    Parse a zero-padded DD-MM-YYYY date without strptime
+
+    Returns None for anything else (including impossible dates such as
+    31-02-2024), so callers can fall back to strptime for other layouts.
+    """
+    if len(date_str) == 10 and date_str[2] == '-' and date_str[5] == '-':
+        digits = date_str[:2] + date_str[3:5] + date_str[6:]
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(int(digits[4:]), int(digits[2:4]), int(digits[:2]))
+            except ValueError:
+                return None
+    return None
 
 
 def get_current_date(format_str: str = "%d-%m-%Y") -> str:
@@ -188,13 +313,28 @@ def get_current_date(format_str: str = "%d-%m-%Y") -> str:
     Returns:
         Current date string
     """
+    if format_str in _DAY_FORMATS:
+        return _format_day(date.today(), format_str)
     return datetime.now().strftime(format_str)
 
 
+# Date-only formats: the result changes once a day, so it can be cached
+_DAY_FORMATS = frozenset(("%d-%m-%Y", "%Y-%m-%d"))
+
+
+@lru_cache(maxsize=4)
+def _format_day(day: date, format_str: str) -> str:
+    """Format a date (cached - the same day is asked for repeatedly)"""
+    return day.strftime(format_str)
+
+
+@lru_cache(maxsize=8192)
 def normalize_date_for_sort(date_str: str) -> str:
     """
     Convert any date format to YYYY-MM-DD for proper string sorting
 
+    Results are cached - ledgers and sorts see the same few dates repeatedly.
+
     Args:
         date_str: Date string in any format
 
@@ -204,7 +344,15 @@ def normalize_date_for_sort(date_str: str) -> str:
     if not date_str:
         return ''
 
-    # Try DD-MM-YYYY format
+    # Already YYYY-MM-DD shaped: returned as-is whether or not it parses
+    if len(date_str) == 10 and date_str[4] == '-':
+        return date_str
+
+    # Zero-padded DD-MM-YYYY (the stored format): just reorder the parts
+    if _parse_dd_mm_yyyy(date_str) is not None:
+        return f"{date_str[6:]}-{date_str[3:5]}-{date_str[:2]}"
+
+    # Try DD-MM-YYYY format (single-digit day/month)
     try:
         date_obj = datetime.strptime(date_str, "%d-%m-%Y")
         return date_obj.strftime("%Y-%m-%d")
@@ -238,9 +386,10 @@ def sanitize_string(text: str, max_length: int = 500) -> str:
     # Convert to string if not already
     text = str(text).strip()
 
-    # Remove null bytes and control characters (except newlines and tabs)
-    import re
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+    # Remove null bytes and control characters (except newlines and tabs);
+    # isprintable() is a quick C scan that clears almost all real input
+    if not text.isprintable():
+        text = _CONTROL_CHARS_RE.sub('', text)
 
     # Limit length
     if len(text) > max_length:
@@ -300,9 +449,8 @@ def validate_date_input(date_str: str) -> tuple[bool, str]:
     if not date_str:
         return False, "Date is required"
 
-    import re
     # Check format DD-MM-YYYY
-    if not re.match(r'^\d{2}-\d{2}-\d{4}$', date_str):
+    if not _DATE_INPUT_RE.match(date_str):
         return False, "Date must be in DD-MM-YYYY format"
 
     try:
@@ -323,11 +471,9 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    import re
     if not email:
         return True  # Email is optional
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_phone(phone: str) -> bool:
@@ -340,11 +486,18 @@ def validate_phone(phone: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    import re
     # Remove common separators
-    clean_phone = re.sub(r'[\s\-\(\)\.]', '', phone)
+    clean_phone = _PHONE_SEPARATORS_RE.sub('', phone)
     # Check if it's 10-15 digits
-    return bool(re.match(r'^\d{10,15}$', clean_phone))
+    return bool(_PHONE_RE.match(clean_phone))
+
+
+def _strip_currency(text: str) -> str:
+    """Remove currency symbols (₹, Rs., Rs, $, INR) and commas from amount text"""
+    # Chained replace() beats a regex or str.translate here: '₹' makes the
+    # text non-ASCII, which puts translate on its slow per-character path
+    return text.replace('₹', '').replace('Rs.', '').replace('Rs', '').replace(
+        '$', '').replace('INR', '').replace(',', '')
 
 
 def validate_amount(amount_str: str) -> tuple[bool, float]:
@@ -358,9 +511,7 @@ def validate_amount(amount_str: str) -> tuple[bool, float]:
         Tuple of (is_valid, parsed_amount)
     """
     try:
-        # Remove currency symbols (₹, Rs., Rs, $, INR) and commas
-        clean_amount = amount_str.replace('₹', '').replace('Rs.', '').replace('Rs', '').replace('$', '').replace('INR', '').replace(',', '').strip()
-        amount = float(clean_amount)
+        amount = float(_strip_currency(amount_str))
 
         if amount <= 0:
             return False, 0.0
@@ -370,117 +521,195 @@ def validate_amount(amount_str: str) -> tuple[bool, float]:
         return False, 0.0
 
 
-def truncate_string(text: str, max_length: int = 50, suffix: str = "...") -> str:
+def validate_amounts(amount_strs: Iterable[str]) -> list[Optional[float]]:
     """
-    Truncate a string to a maximum length
+    Validate and parse a column of amount strings (e.g. from a CSV import)
+
+    The currency clean-up and float conversion run over the whole column at
+    once instead of once per value; the rules are the same as validate_amount.
 
     Args:
-        text: Text to truncate
-        max_length: Maximum length
-        suffix: Suffix to add if truncated
+        amount_strs: Amount strings to validate
 
     Returns:
-        Truncated string
+        Parsed amount for each valid entry, None for invalid ones
     """
-    if len(text) <= max_length:
-        return text
+    values = list(amount_strs)
+    try:
+        cleaned = _strip_currency('\n'.join(values)).split('\n')
+    except TypeError:
+        cleaned = None  # Non-string entries
+
+    if cleaned is None or len(cleaned) != len(values):
+        # Entries containing newlines or non-strings: validate one by one
+        return [amount if valid else None for valid, amount in map(validate_amount, values)]
+
+    try:
+        # Usually every value parses, so convert the whole column in one map()
+        amounts = list(map(float, cleaned))
+    except ValueError:
+        amounts = []
+        for text in cleaned:
+            try:
+                amounts.append(float(text))
+            except ValueError:
+                amounts.append(0.0)
 
-    return text[:max_length - len(suffix)] + suffix
+    return [None if amount <= 0 else amount for amount in amounts]
 
 
-def get_balance_color(balance: float) -> str:
+def validate_emails(emails: Iterable[str]) -> list[bool]:
     """
-    Get color indicator for balance amount
+    Validate a column of email addresses (same rules as validate_email)
 
     Args:
-        balance: Balance amount
+        emails: Email addresses to validate
 
     Returns:
-        Color name for CustomTkinter
+        True for each valid or empty entry, False otherwise
     """
-    if balance > 0:
-        return "green"
-    elif balance < 0:
-        return "red"
-    else:
-        return "gray"
+    match = _EMAIL_RE.match
+    return [not email or match(email) is not None for email in emails]
+
+
+_DEFAULT_SUFFIX = "..."
+_DEFAULT_SUFFIX_LEN = len(_DEFAULT_SUFFIX)
+
+
+def truncate_string(text: str, max_length: int = 50, suffix: str = _DEFAULT_SUFFIX) -> str:
+    """
+    Truncate a string to a maximum length
+
+    Args:
+        text: Text to truncate
+        max_length: Maximum length
+        suffix: Suffix to add if truncated
+
+    Returns:
+        Truncated string
+    """
+    if len(text) <= max_length:
+        return text
+
+    cut = max_length - (_DEFAULT_SUFFIX_LEN if suffix is _DEFAULT_SUFFIX else len(suffix))
+    if cut <= 0:
+        # No room for any text - a negative slice would keep most of it
+        return suffix[:max_length]
+
+    return text[:cut] + suffix
 
 
-def export_to_csv(data: list[dict], filename: str, fieldnames: list[str] = None):
+def export_to_csv(data: Iterable[dict], filename: str, fieldnames: list[str] = None):
     """
     Export data to CSV file
 
     Args:
-        data: List of dictionaries to export
+        data: Dictionaries to export (any iterable - rows are written as they arrive)
         filename: Output filename
-        fieldnames: List of field names (if None, uses keys from first row)
+        fieldnames: List of field names (if None, uses keys from first row).
+                    Keys not listed are left out; missing keys are written empty.
     """
-    import csv
-
-    if not data:
+    rows = iter(data)
+    first_row = next(rows, None)
+    if first_row is None:
         raise ValueError("No data to export")
 
     if fieldnames is None:
-        fieldnames = list(data[0].keys())
+        fieldnames = list(first_row.keys())
 
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    # Project each row to a tuple in C instead of DictWriter's per-cell lookups
+    if not fieldnames:
+        # Nothing selected: an empty header and an empty line per row
+        def project(row):
+            return ()
+    else:
+        getter = itemgetter(*fieldnames)
+        # itemgetter with a single key returns the bare value, not a tuple
+        single_field = len(fieldnames) == 1
 
+        def project(row):
+            try:
+                values = getter(row)
+            except KeyError:
+                return [row.get(field, '') for field in fieldnames]
+            return (values,) if single_field else values
 
-def import_from_csv(filename: str) -> list[dict]:
-    """
-    Import data from CSV file
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerow(project(first_row))
+        writer.writerows(map(project, rows))
 
-    Args:
-        filename: Input filename
 
-    Returns:
-        List of dictionaries
+def import_from_csv_iter(filename: str) -> Iterator[dict]:
     """
-    import csv
+    Read a CSV file one row at a time
 
-    with open(filename, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        return list(reader)
+    Rows are produced as the file is read, so memory use stays constant
+    however large the file is.
 
+    Args:
+        filename: Input filename
 
-def show_error_message(title: str, message: str):
+    Yields:
+        One dictionary per row (same shape csv.DictReader would give)
     """
-    Display error message (placeholder for GUI integration)
-
-    Args:
-        title: Error title
-        message: Error message
+    with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+        # Plain reader + zip builds each row dict in C; DictReader does it in Python
+        reader = csv.reader(csvfile)
+        fieldnames = next(reader, None)
+        if fieldnames is None:
+            return
+        width = len(fieldnames)
+
+        for row in reader:
+            if len(row) == width:
+                yield dict(zip(fieldnames, row))
+            elif row:
+                # Ragged row: same result DictReader would give
+                record = dict(zip(fieldnames, row))
+                if len(row) < width:
+                    record.update(dict.fromkeys(fieldnames[len(row):]))
+                else:
+                    record[None] = row[width:]
+                yield record
+
+
+def iter_csv_chunks(filename: str, chunk_size: int = 1000) -> Iterator[list[dict]]:
     """
-    print(f"ERROR - {title}: {message}")
-
+    Read a CSV file in chunks of rows
 
-def show_success_message(title: str, message: str):
-    """
-    Display success message (placeholder for GUI integration)
+    Only one chunk is held in memory at a time, so large imports can be
+    processed (e.g. passed to DatabaseManager.add_transactions_many) as
+    they are read.
 
     Args:
-        title: Success title
-        message: Success message
+        filename: Input filename
+        chunk_size: Maximum number of rows per chunk
+
+    Yields:
+        Lists of up to chunk_size dictionaries
     """
-    print(f"SUCCESS - {title}: {message}")
+    rows = import_from_csv_iter(filename)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
 
 
-def confirm_action(title: str, message: str) -> bool:
+def import_from_csv(filename: str) -> list[dict]:
     """
-    Confirm an action (placeholder for GUI integration)
+    Import data from CSV file
 
     Args:
-        title: Confirmation title
-        message: Confirmation message
+        filename: Input filename
 
     Returns:
-        True if confirmed, False otherwise
+        List of dictionaries
     """
-    response = input(f"{title}: {message} (y/n): ")
-    return response.lower() == 'y'
+    return list(import_from_csv_iter(filename))
+
+
+# Dropdowns with more options than this use a Listbox instead of buttons
+LISTBOX_THRESHOLD = 30
 
 
 class DropdownButton:
@@ -502,9 +731,16 @@ class DropdownButton:
             font: Button font
             placeholder: Placeholder text when no selection
         """
-        self.values = values
+        import tkinter as tk
+        import customtkinter as ctk
+        self._ctk = ctk
+        self._tk = tk
+
+        self.update_values(values)
         self.callback = callback
         self.dropdown_window = None
+        self._is_open = False
+        self._built_for = None
         self.current_value = placeholder
         self.placeholder = placeholder
 
@@ -521,6 +757,7 @@ class DropdownButton:
             command=self.show_dropdown,
             cursor="hand2"
         )
+        self.button.bind("<Destroy>", self.destroy, add="+")
 
     def pack(self, **kwargs):
         """Pack the button"""
@@ -537,21 +774,30 @@ class DropdownButton:
 
     def show_dropdown(self):
         """Show dropdown menu"""
+        ctk = self._ctk
         # Close existing dropdown if open
-        if self.dropdown_window:
+        if self._is_open:
             self.close_dropdown()
             return
 
-        # Don't show if no values
-        if not self.values or len(self.values) == 0:
+        # Don't show if there is nothing to choose
+        options = self._filtered_values
+        if not options:
             return
 
-        # Create toplevel window for dropdown
-        self.dropdown_window = ctk.CTkToplevel(self.button)
-        self.dropdown_window.withdraw()
+        # The popup window is created once and then only hidden/shown -
+        # creating a Toplevel is one of the slowest things Tk does
+        if self.dropdown_window is None or not self.dropdown_window.winfo_exists():
+            self.dropdown_window = ctk.CTkToplevel(self.button)
+            self.dropdown_window.withdraw()
+
+            # Remove window decorations
+            self.dropdown_window.overrideredirect(True)
 
-        # Remove window decorations
-        self.dropdown_window.overrideredirect(True)
+            # Bind events to close dropdown
+            self.dropdown_window.bind("<FocusOut>", lambda e: self.close_dropdown())
+            self.dropdown_window.bind("<Escape>", lambda e: self.close_dropdown())
+            self._built_for = None
 
         # Calculate position
         self.button.update()
@@ -564,7 +810,7 @@ class DropdownButton:
         # Calculate dropdown height
         item_height = 35
         max_height = 300
-        dropdown_height = min(len(self.values) * item_height + 10, max_height)
+        dropdown_height = min(len(options) * item_height + 10, max_height)
 
         # Check if dropdown would go off bottom of screen
         if y + dropdown_height > screen_height - 50:
@@ -574,8 +820,30 @@ class DropdownButton:
         width = self.button.winfo_width()
         self.dropdown_window.geometry(f"{width}x{dropdown_height}+{x}+{y}")
 
+        # Rebuild the options only when the values or the width changed
+        if self._built_for != (self._values_version, width):
+            for child in self.dropdown_window.winfo_children():
+                child.destroy()
+
+            # Long lists use one native Listbox; short ones keep the styled buttons
+            if len(options) > LISTBOX_THRESHOLD:
+                self._build_listbox(options)
+            else:
+                self._build_buttons(options, width, dropdown_height, item_height, max_height)
+            self._built_for = (self._values_version, width)
+
+        # Show window
+        self._is_open = True
+        self.dropdown_window.deiconify()
+        self.dropdown_window.lift()
+        self.dropdown_window.focus_force()
+
+    def _build_buttons(self, options: List[str], width: int, dropdown_height: int,
+                       item_height: int, max_height: int):
+        """Fill the dropdown with one button per option (short lists)"""
+        ctk = self._ctk
         # Create scrollable frame for options
-        if len(self.values) * item_height > max_height:
+        if len(options) * item_height > max_height:
             container = ctk.CTkScrollableFrame(
                 self.dropdown_window,
                 width=width-10,
@@ -593,10 +861,7 @@ class DropdownButton:
             container.pack(fill="both", expand=True, padx=5, pady=5)
 
         # Add options
-        for value in self.values:
-            if value == "Select..." or "No entities" in value:
-                continue
-
+        for value in options:
             option_btn = ctk.CTkButton(
                 container,
                 text=value,
@@ -609,14 +874,42 @@ class DropdownButton:
             )
             option_btn.pack(fill="x", padx=5, pady=2)
 
-        # Show window
-        self.dropdown_window.deiconify()
-        self.dropdown_window.lift()
-        self.dropdown_window.focus_force()
+    def _build_listbox(self, options: List[str]):
+        """
+        Fill the dropdown with a single native Listbox (long lists)
+
+        One Tk widget draws every row, instead of a CTkButton per option.
+        """
+        ctk, tk = self._ctk, self._tk
+        dark = ctk.get_appearance_mode() == "Dark"
+        listbox = tk.Listbox(
+            self.dropdown_window,
+            font=("Roboto", 13),
+            activestyle="none",
+            borderwidth=0,
+            highlightthickness=0,
+            bg="gray15" if dark else "gray95",
+            fg="gray90" if dark else "gray10",
+            selectbackground="gray25" if dark else "gray85",
+            selectforeground="gray90" if dark else "gray10"
+        )
+        scrollbar = ctk.CTkScrollbar(self.dropdown_window, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y", pady=5)
+        listbox.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
+
+        listbox.insert(tk.END, *options)
+
+        def highlight(event):
+            listbox.selection_clear(0, tk.END)
+            listbox.selection_set(listbox.nearest(event.y))
 
-        # Bind events to close dropdown
-        self.dropdown_window.bind("<FocusOut>", lambda e: self.close_dropdown())
-        self.dropdown_window.bind("<Escape>", lambda e: self.close_dropdown())
+        listbox.bind("<Motion>", highlight)
+        # Select on click; "break" stops the Listbox taking focus (which would
+        # trigger the window's <FocusOut> and close it before the release)
+        listbox.bind("<Button-1>", lambda e: "break")
+        listbox.bind("<ButtonRelease-1>",
+                     lambda e: self.select_option(listbox.get(listbox.nearest(e.y))))
 
     def select_option(self, value: str):
         """Handle option selection"""
@@ -634,21 +927,206 @@ class DropdownButton:
         self.close_dropdown()
 
     def close_dropdown(self):
-        """Close dropdown menu"""
+        """Close dropdown menu (hidden, and reused on the next open)"""
+        self._is_open = False
+        if self.dropdown_window:
+            try:
+                self.dropdown_window.withdraw()
+            except self._tk.TclError:
+                self.dropdown_window = None
+
+    def destroy(self, event=None):
+        """Destroy the dropdown window (called when the button goes away)"""
+        self._is_open = False
         if self.dropdown_window:
             try:
                 self.dropdown_window.destroy()
-            except:
+            except self._tk.TclError:
                 pass
             self.dropdown_window = None
 
     def update_values(self, values: List[str]):
         """Update dropdown values"""
         self.values = values
+        self._values_version = getattr(self, '_values_version', 0) + 1
+        # Selectable options, without placeholder entries (filtered once, not per open)
+        self._filtered_values = [
+            value for value in values or ()
+            if value != "Select..." and "No entities" not in value
+        ]
 
 
 # ==================== PDF Export Functions ====================
 
+def _pdf_text_cell(value) -> str:
+    """PDF cell text for a plain value ('-' when empty)"""
+    return str(value) if value else '-'
+
+
+def _pdf_currency_cell(value) -> str:
+    """PDF cell text for an amount/balance value"""
+    if value != '':
+        try:
+            value = format_currency(float(value))
+        except (TypeError, ValueError):
+            pass
+    return str(value) if value else '-'
+
+
+def _pdf_truncated_cell(max_length: int) -> Callable:
+    """Build a PDF cell formatter that shortens text longer than max_length"""
+    def format_cell(value) -> str:
+        return truncate_string(str(value), max_length) if value else '-'
+    return format_cell
+
+
+# Columns whose PDF cells need more than _pdf_text_cell
+_PDF_CELL_FORMATTERS = {
+    'amount': _pdf_currency_cell,
+    'balance': _pdf_currency_cell,
+    'description': _pdf_truncated_cell(30),
+    'address': _pdf_truncated_cell(25),
+}
+
+
+def _pdf_cell_formatter(field: str) -> Callable:
+    """Get the function that turns a raw value of this column into PDF cell text"""
+    return _PDF_CELL_FORMATTERS.get(field, _pdf_text_cell)
+
+
+# PDF column headings for known fields (others are title-cased)
+_PDF_HEADER_NAMES = MappingProxyType({
+    'id': 'ID',
+    'transaction_date': 'Date',
+    'amount': 'Amount',
+    'from_name': 'From',
+    'to_name': 'To',
+    'description': 'Description',
+    'name': 'Name',
+    'address': 'Address',
+    'phone': 'Phone',
+    'email': 'Email',
+    'balance': 'Balance',
+    'role': 'Role',
+    'department': 'Department'
+})
+
+
+@lru_cache(maxsize=32)
+def _pdf_header_row(fieldnames: tuple) -> tuple:
+    """Column headings for a PDF table (cached per field list)"""
+    return tuple(_PDF_HEADER_NAMES.get(field, field.replace('_', ' ').title())
+                 for field in fieldnames)
+
+
+@lru_cache(maxsize=32)
+def _pdf_col_widths(fieldnames: tuple, is_transaction: bool) -> Optional[tuple]:
+    """Fixed column widths for the known report layouts, None for any other"""
+    from reportlab.lib.units import cm
+
+    if is_transaction:
+        # Transaction report: ID, Date, Amount, From, To, Description
+        return (0.8*cm, 2.2*cm, 2.5*cm, 5*cm, 5*cm, 6*cm)
+    if 'address' in fieldnames:
+        # Company report: ID, Name, Address, Phone, Email, Balance
+        return (1*cm, 4*cm, 4*cm, 2.5*cm, 4*cm, 2.5*cm)
+    if 'department' in fieldnames:
+        # User report: ID, Name, Email, Role, Department, Balance
+        return (1*cm, 3.5*cm, 4.5*cm, 2.5*cm, 3*cm, 2.5*cm)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _pdf_styles() -> Dict:
+    """
+    Paragraph styles for export_to_pdf, built on first use and then reused
+
+    ReportLab is imported here rather than at module level: it is optional and
+    only needed when a PDF is actually exported.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+
+    styles = getSampleStyleSheet()
+    return {
+        # Custom title style
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=20,
+            textColor=colors.HexColor('#1f77b4'),
+            spaceAfter=20,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'date': ParagraphStyle(
+            'DateStyle',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.grey,
+            alignment=TA_RIGHT,
+            spaceAfter=15
+        ),
+        'no_data': ParagraphStyle(
+            'NoData',
+            parent=styles['Normal'],
+            fontSize=14,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        ),
+    }
+
+
+@lru_cache(maxsize=2)
+def _pdf_table_style(is_transaction: bool):
+    """Table style for export_to_pdf (two variants: amount column position differs)"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        # Header styling
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('TOPPADDING', (0, 0), (-1, 0), 8),
+
+        # Data styling
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('TOPPADDING', (0, 1), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+
+        # Center align ID column
+        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+
+        # Right align amount/balance columns
+        ('ALIGN', (2, 1), (2, -1), 'RIGHT') if is_transaction else ('ALIGN', (-1, 1), (-1, -1), 'RIGHT'),
+
+        # Grid
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+
+        # Alternating row colors
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+
+        # Word wrap for long text
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+
+
 def export_to_pdf(data: List[Dict], filename: str, title: str, fieldnames: List[str] = None):
     """
     Export data to PDF file with professional formatting
@@ -659,13 +1137,11 @@ def export_to_pdf(data: List[Dict], filename: str, title: str, fieldnames: List[
         title: Title of the report
         fieldnames: List of field names to include (if None, use all from first row)
     """
-    from reportlab.lib import colors
     from reportlab.lib.pagesizes import A4, landscape
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
     from reportlab.lib.units import inch, cm
-    from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
-    from datetime import datetime
+
+    styles = _pdf_styles()
 
     # Determine if this is a transaction report (needs landscape)
     is_transaction = fieldnames and 'transaction_date' in fieldnames
@@ -678,46 +1154,17 @@ def export_to_pdf(data: List[Dict], filename: str, title: str, fieldnames: List[
 
     elements = []
 
-    # Styles
-    styles = getSampleStyleSheet()
-
-    # Custom title style
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-
     # Add title
-    elements.append(Paragraph(title, title_style))
+    elements.append(Paragraph(title, styles['title']))
 
     # Add generation date
-    date_style = ParagraphStyle(
-        'DateStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.grey,
-        alignment=TA_RIGHT,
-        spaceAfter=15
-    )
     generation_date = f"Generated on: {datetime.now().strftime('%d %B, %Y at %H:%M')}"
-    elements.append(Paragraph(generation_date, date_style))
+    elements.append(Paragraph(generation_date, styles['date']))
     elements.append(Spacer(1, 0.1 * inch))
 
     if not data:
         # No data message
-        no_data_style = ParagraphStyle(
-            'NoData',
-            parent=styles['Normal'],
-            fontSize=14,
-            textColor=colors.grey,
-            alignment=TA_CENTER
-        )
-        elements.append(Paragraph("No data available", no_data_style))
+        elements.append(Paragraph("No data available", styles['no_data']))
     else:
         # Determine fieldnames
         if not fieldnames:
@@ -727,115 +1174,32 @@ def export_to_pdf(data: List[Dict], filename: str, title: str, fieldnames: List[
         table_data = []
 
         # Header row with better names
-        header_names = {
-            'id': 'ID',
-            'transaction_date': 'Date',
-            'amount': 'Amount',
-            'from_name': 'From',
-            'to_name': 'To',
-            'description': 'Description',
-            'name': 'Name',
-            'address': 'Address',
-            'phone': 'Phone',
-            'email': 'Email',
-            'balance': 'Balance',
-            'role': 'Role',
-            'department': 'Department'
-        }
-        header_row = [header_names.get(field, field.replace('_', ' ').title()) for field in fieldnames]
-        table_data.append(header_row)
-
-        # Data rows
-        for row in data:
-            table_row = []
-            for field in fieldnames:
-                value = row.get(field, '')
-
-                # Format currency fields
-                if field in ['balance', 'amount'] and value != '':
-                    try:
-                        value = format_currency(float(value))
-                    except:
-                        pass
-
-                # Truncate long descriptions
-                if field == 'description' and len(str(value)) > 30:
-                    value = str(value)[:27] + '...'
-
-                # Truncate long addresses
-                if field == 'address' and len(str(value)) > 25:
-                    value = str(value)[:22] + '...'
-
-                table_row.append(str(value) if value else '-')
-            table_data.append(table_row)
-
-        # Define column widths based on report type
-        if is_transaction:
-            # Transaction report: ID, Date, Amount, From, To, Description
-            col_widths = [0.8*cm, 2.2*cm, 2.5*cm, 5*cm, 5*cm, 6*cm]
-        elif fieldnames and 'address' in fieldnames:
-            # Company report: ID, Name, Address, Phone, Email, Balance
-            col_widths = [1*cm, 4*cm, 4*cm, 2.5*cm, 4*cm, 2.5*cm]
-        elif fieldnames and 'department' in fieldnames:
-            # User report: ID, Name, Email, Role, Department, Balance
-            col_widths = [1*cm, 3.5*cm, 4.5*cm, 2.5*cm, 3*cm, 2.5*cm]
-        else:
-            col_widths = None
+        table_data.append(list(_pdf_header_row(tuple(fieldnames))))
+
+        # Data rows - the per-column formatting is chosen once, not per cell
+        columns = [(field, _pdf_cell_formatter(field)) for field in fieldnames]
+        table_data.extend(
+            [format_cell(row.get(field, '')) for field, format_cell in columns]
+            for row in data
+        )
+
+        # Column widths based on report type
+        col_widths = _pdf_col_widths(tuple(fieldnames), bool(is_transaction))
 
         # Create table with fixed widths
         if col_widths:
-            table = Table(table_data, colWidths=col_widths)
+            table = Table(table_data, colWidths=list(col_widths))
         else:
             table = Table(table_data)
 
         # Table styling
-        table.setStyle(TableStyle([
-            # Header styling
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-
-            # Data styling
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-
-            # Center align ID column
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-
-            # Right align amount/balance columns
-            ('ALIGN', (2, 1), (2, -1), 'RIGHT') if is_transaction else ('ALIGN', (-1, 1), (-1, -1), 'RIGHT'),
-
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-
-            # Alternating row colors
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-
-            # Word wrap for long text
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table.setStyle(_pdf_table_style(bool(is_transaction)))
 
         elements.append(table)
 
         # Add footer with count
         elements.append(Spacer(1, 0.2 * inch))
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.grey,
-            alignment=TA_CENTER
-        )
-        elements.append(Paragraph(f"Total Records: {len(data)}", footer_style))
+        elements.append(Paragraph(f"Total Records: {len(data)}", styles['footer']))
 
     # Build PDF
     doc.build(elements)